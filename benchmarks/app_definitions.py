@@ -0,0 +1,34 @@
+"""Load selected definitions from streamlit_app.py without running the page.
+
+Importing streamlit_app renders the whole UI and starts its background
+threads, so the benchmarks compile only the module's imports plus the
+functions, classes and constants they exercise.
+"""
+import ast
+import pathlib
+
+APP_PATH = pathlib.Path(__file__).resolve().parent.parent / "streamlit_app.py"
+
+def load_definitions(*names, **overrides):
+    """Namespace holding `names` from streamlit_app.py, in file order.
+
+    `overrides` are placed in the namespace first, e.g. to stand in for a
+    process-wide singleton the selected code looks up by name.
+    """
+    tree = ast.parse(APP_PATH.read_text(encoding="utf-8"))
+    body = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            body.append(node)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)) and node.name in names:
+            body.append(node)
+        elif isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id in names for target in node.targets
+        ):
+            body.append(node)
+    namespace = {"__name__": "streamlit_app_definitions", **overrides}
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(APP_PATH), "exec"), namespace)
+    missing = [name for name in names if name not in namespace]
+    if missing:
+        raise NameError(f"Not defined in {APP_PATH.name}: {', '.join(missing)}")
+    return namespace
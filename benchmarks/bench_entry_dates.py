@@ -0,0 +1,99 @@
+"""Benchmark of entry date handling over 10k synthetic RSS entries.
+
+Compares the previous per-render path (dateutil-parse every entry to
+filter, then again in the sort key) with the current split: one-off
+normalization at ingest (normalize_entries) and the per-render recency
+cut + newest-first sort over the timestamp array (aggregate_city_feeds).
+
+    python benchmarks/bench_entry_dates.py
+"""
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+import feedparser
+import pandas as pd
+from dateutil import parser as date_parser
+
+from app_definitions import load_definitions
+
+ENTRIES = 10_000
+WINDOW_MINUTES = 60
+FEED_URL = "https://news.example.com/rss"
+
+class MemoryPoller:
+    """Stands in for the background feed poller: serves prepared feed data from memory"""
+
+    def __init__(self):
+        self.feeds = {}
+
+    def watch(self, urls):
+        pass
+
+    def get(self, url):
+        return self.feeds.get(url)
+
+    def fetch(self, urls):
+        return {}
+
+POLLER = MemoryPoller()
+
+app = load_definitions(
+    "entry_timestamp", "ENTRY_SUMMARY_MAX_CHARS", "IMG_SRC_RE", "TAG_DELIMITER_RE", "tag_end",
+    "first_img_src", "extract_entry_image", "ENTRY_COLUMNS", "HTML_TAG_RE", "strip_html",
+    "normalize_entries", "FeedEntry", "aggregate_city_feeds",
+    get_feed_poller=lambda: POLLER,
+)
+
+def synthetic_feed(count, seed=1):
+    """RSS document whose items were published over the last two hours, in random order"""
+    rng = random.Random(seed)
+    now = time.time()
+    items = []
+    for i in range(count):
+        published = time.strftime("%a, %d %b %Y %H:%M:%S +0000", time.gmtime(now - rng.uniform(0, 7200)))
+        items.append(f"<item><title>Story {i}</title><link>https://news.example.com/{i}</link>"
+                     f"<description>Summary of story {i}</description><pubDate>{published}</pubDate></item>")
+    return f"<rss><channel><title>Synthetic</title>{''.join(items)}</channel></rss>"
+
+def parse_each_render(entries, minutes):
+    """Previous per-render path: parse to filter, parse again to sort"""
+    now = datetime.now(timezone.utc)
+    recent = []
+    for entry in entries:
+        published = date_parser.parse(entry["published"])
+        if now - published <= timedelta(minutes=minutes):
+            recent.append(entry)
+    recent.sort(key=lambda entry: date_parser.parse(entry["published"]), reverse=True)
+    return recent
+
+def timed(fn, *args, repeat=1):
+    samples, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), result
+
+def main():
+    raw = feedparser.parse(synthetic_feed(ENTRIES)).entries
+    df_city = pd.DataFrame({"url": [FEED_URL], "name": ["Synthetic"]})
+
+    old_time, old_recent = timed(parse_each_render, raw, WINDOW_MINUTES)
+    ingest_time, columns = timed(app["normalize_entries"], raw)
+    POLLER.feeds[FEED_URL] = {"feed": {"title": "Synthetic"}, "entries": columns}
+    render_time, city_news = timed(app["aggregate_city_feeds"], df_city, WINDOW_MINUTES, "UTC", repeat=20)
+
+    new_recent = city_news["entries"]
+    # Entries right at the window edge may differ (each path reads the clock itself); order must not
+    new_links = {entry.link for entry in new_recent}
+    old_links = [entry["link"] for entry in old_recent if entry["link"] in new_links]
+    assert old_links == [entry.link for entry in new_recent if entry.link in set(old_links)], "order differs"
+    print(f"{ENTRIES} entries, {WINDOW_MINUTES} minute window, {len(new_recent)} recent")
+    print(f"  previous per-render parse + filter + sort-by-parse: {old_time * 1e3:8.1f} ms")
+    print(f"  one-off ingest normalization (normalize_entries):   {ingest_time * 1e3:8.1f} ms")
+    print(f"  per-render filter + sort (aggregate_city_feeds):    {render_time * 1e3:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Micro-benchmark of is_geo_blocked() on large synthetic response bodies.
+
+Compares the bounded raw-bytes prefix scan with the previous approach
+(decode the whole body, lowercase it, search every term), reporting the
+mean CPU time per call and the tracemalloc peak of one call.
+
+    python benchmarks/bench_geo_block.py
+"""
+import random
+import string
+import time
+import tracemalloc
+
+from app_definitions import load_definitions
+
+CALLS = 20
+SIZES = {"100 KB": 100 * 1024, "1 MB": 1024 * 1024, "5 MB": 5 * 1024 * 1024}
+
+app = load_definitions(
+    "GEO_BLOCK_TERMS", "GEO_BLOCK_SCAN_BYTES", "GEO_BLOCK_SKIP_HOSTS",
+    "compile_geo_block_matcher", "GEO_BLOCK_MATCHER", "is_geo_blocked",
+)
+
+def decode_and_search(content):
+    """Previous implementation: response.text.lower() over the whole body"""
+    text = content.decode("utf-8", errors="replace").lower()
+    return any(term in text for term in app["GEO_BLOCK_TERMS"])
+
+def synthetic_body(size, seed=1):
+    rng = random.Random(seed)
+    block = "".join(rng.choices(string.ascii_letters + " <>/", k=1024)).encode()
+    return (block * (size // len(block) + 1))[:size]
+
+def measure(check, content):
+    start = time.process_time()
+    for _ in range(CALLS):
+        check(content)
+    cpu = (time.process_time() - start) / CALLS
+    tracemalloc.start()
+    check(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu, peak
+
+def main():
+    url = "https://news.example.com/rss"
+    checks = {
+        "decode + lower": decode_and_search,
+        "bounded prefix": lambda content: app["is_geo_blocked"](content, url),
+    }
+    print(f"{'body':>7}  {'method':<15} {'cpu/call':>10} {'peak':>10}")
+    for label, size in SIZES.items():
+        content = synthetic_body(size)
+        for name, check in checks.items():
+            cpu, peak = measure(check, content)
+            print(f"{label:>7}  {name:<15} {cpu * 1e3:>7.2f} ms {peak / 1024:>7.0f} KiB")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
 import streamlit as st
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+import aiohttp
+import asyncio
 import pandas as pd
+import numpy as np
 import os
 import chardet
-from datetime import datetime, timedelta
+from datetime import datetime
 import pytz
 from timezonefinder import TimezoneFinder
 from bs4 import BeautifulSoup
@@ -12,11 +17,31 @@ from dateutil import parser as date_parser
 import streamlit.components.v1 as components
 from gtts import gTTS
 import tempfile
+import io
+import sqlite3
+import pickle
 import urllib.parse
+import http.cookiejar
 import re
+import html
+import string
+import csv
+import zipfile
+from lxml import etree
 import json
 import time
+import calendar
+import random
+import threading
+import shutil
+from contextlib import contextmanager
+from collections import deque, OrderedDict
 import concurrent.futures
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to the in-process lock only
+    fcntl = None
 
 # =============== Updated Global Constants ===============
 WEATHER_MAP = {
@@ -50,131 +75,1102 @@ WEATHER_MAP = {
     99: ("⛈️", "Thunderstorm with heavy hail"),
 }
 
-# =============== Proxy Management ===============
-PROXY_PROVIDERS = [
-    "https://api.proxyscrape.com/v2/?request=getproxies&protocol=http&timeout=10000&country=all",
-    "https://api.proxyscrape.com/?request=displayproxies&protocol=http&timeout=10000&country=all",
-    "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/http.txt"
-]
+# =============== HTTP Sessions ===============
+HTTP_POOL_CONNECTIONS = 32    # hosts kept per session
+HTTP_POOL_MAXSIZE = 16        # keep-alive connections per host
+HTTP_MAX_PROXY_SESSIONS = 16  # proxy routes kept open at once
 
-@st.cache_data(ttl=600)
-def fetch_proxy_list():
-    """Fetch and cache proxies from multiple providers"""
-    proxies = []
-    for url in PROXY_PROVIDERS:
+class ConnectionStats:
+    """Thread-safe counters for requests sent vs. connections opened"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def record(self, requests_sent=0, new_connections=0):
+        with self.lock:
+            self.requests += requests_sent
+            self.new_connections += new_connections
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "http_requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": max(self.requests - self.new_connections, 0),
+            }
+
+def counting_pool_class(base, stats):
+    """Subclass a urllib3 connection pool so it reports requests and new connections"""
+    class CountingPool(base):
+        def _new_conn(self):
+            stats.record(new_connections=1)
+            return super()._new_conn()
+
+        def _make_request(self, *args, **kwargs):
+            stats.record(requests_sent=1)
+            return super()._make_request(*args, **kwargs)
+
+    CountingPool.__name__ = f"Counting{base.__name__}"
+    return CountingPool
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools feed a ConnectionStats"""
+
+    def __init__(self, stats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self._instrument(self.poolmanager)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        self._instrument(manager)
+        return manager
+
+    def _instrument(self, manager):
+        if getattr(manager, "counting", False):
+            return
+        manager.pool_classes_by_scheme = {
+            scheme: counting_pool_class(pool_cls, self.stats)
+            for scheme, pool_cls in manager.pool_classes_by_scheme.items()
+        }
+        manager.counting = True
+
+class HttpSessionPool:
+    """Shared keep-alive requests.Session objects, one per direct/proxy route"""
+
+    def __init__(self, pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                 max_proxy_sessions=HTTP_MAX_PROXY_SESSIONS):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_proxy_sessions = max_proxy_sessions
+        self.stats = ConnectionStats()
+        self.lock = threading.Lock()
+        self.direct = self._new_session()
+        self.proxied = {}  # proxy url -> session, oldest first
+
+    def _new_session(self):
+        session = requests.Session()
+        # Sessions are shared by every host and viewer; keep no cookies between requests
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        adapter = CountingHTTPAdapter(
+            self.stats, pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def session_for(self, proxies=None):
+        route = (proxies or {}).get("https") or (proxies or {}).get("http")
+        if not route:
+            return self.direct
+        with self.lock:
+            session = self.proxied.pop(route, None)
+            if session is None:
+                session = self._new_session()
+                if len(self.proxied) >= self.max_proxy_sessions:
+                    oldest = next(iter(self.proxied))
+                    self.proxied.pop(oldest).close()
+            self.proxied[route] = session  # re-insert as most recently used
+            return session
+
+    def get(self, url, proxies=None, **kwargs):
+        return self.session_for(proxies).get(url, proxies=proxies, **kwargs)
+
+@st.cache_resource(show_spinner=False)
+def get_http_sessions():
+    """Create the shared HTTP sessions once per process"""
+    return HttpSessionPool()
+
+# Bound at module level so background threads reach it without a script run context
+HTTP_SESSIONS = get_http_sessions()
+
+# =============== Circuit Breakers ===============
+BREAKER_FAILURE_THRESHOLD = 3  # consecutive failed calls before a host's breaker opens
+BREAKER_BASE_BACKOFF = 30      # seconds; doubles with every consecutive trip
+BREAKER_MAX_BACKOFF = 1800
+RETRY_BUDGET_PER_RENDER = 10   # proxy retries one page render may spend across all requests
+
+class HostCircuitBreakers:
+    """Per-host closed/open/half-open breakers with exponential backoff and jitter.
+
+    While a host's breaker is open, page renders fail fast. Once its backoff
+    has elapsed a single trial request is made from a background thread;
+    success closes the breaker, failure re-opens it with a longer backoff.
+    """
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD,
+                 base_backoff=BREAKER_BASE_BACKOFF, max_backoff=BREAKER_MAX_BACKOFF):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.lock = threading.Lock()
+        self.hosts = {}  # host -> {"state", "failures", "trips", "retry_at", "trial_scheduled"}
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="lews-breaker-trial"
+        )
+
+    def allow(self, url, background):
+        """Return True if a request to url's host may go out now"""
+        host = urllib.parse.urlparse(url).netloc
+        schedule_trial = False
+        with self.lock:
+            breaker = self.hosts.get(host)
+            if not breaker or breaker["state"] == "closed":
+                return True
+            due = breaker["state"] == "open" and time.time() >= breaker["retry_at"]
+            if due and background:
+                breaker["state"] = "half_open"  # this caller is the trial request
+                breaker["trial_scheduled"] = False
+                return True
+            if due and not breaker["trial_scheduled"]:
+                breaker["trial_scheduled"] = schedule_trial = True
+        if schedule_trial:
+            # Retry the host off the render path; the result only updates the breaker
+            self.executor.submit(smart_request, url, 1)
+        return False
+
+    def record(self, url, success):
+        host = urllib.parse.urlparse(url).netloc
+        with self.lock:
+            breaker = self.hosts.setdefault(host, {
+                "state": "closed", "failures": 0, "trips": 0, "retry_at": 0, "trial_scheduled": False,
+            })
+            if success:
+                breaker.update(state="closed", failures=0, trips=0, trial_scheduled=False)
+                return
+            breaker["failures"] += 1
+            if breaker["state"] == "half_open" or breaker["failures"] >= self.failure_threshold:
+                breaker["trips"] += 1
+                backoff = min(self.base_backoff * 2 ** (breaker["trips"] - 1), self.max_backoff)
+                backoff *= random.uniform(0.5, 1.0)  # jitter so hosts don't retry in lockstep
+                breaker.update(state="open", failures=0, retry_at=time.time() + backoff,
+                               trial_scheduled=False)
+
+    def snapshot(self):
+        now = time.time()
+        with self.lock:
+            return {
+                host: {
+                    "state": b["state"],
+                    "failures": b["failures"],
+                    "trips": b["trips"],
+                    "retry_in": max(round(b["retry_at"] - now), 0) if b["state"] == "open" else 0,
+                }
+                for host, b in self.hosts.items()
+                if b["state"] != "closed" or b["failures"]
+            }
+
+@st.cache_resource(show_spinner=False)
+def get_host_breakers():
+    """Create the shared circuit breakers once per process"""
+    return HostCircuitBreakers()
+
+HOST_BREAKERS = get_host_breakers()
+
+class RetryBudget:
+    """Proxy retries left for one page render, shared by all of its requests"""
+
+    def __init__(self, retries=RETRY_BUDGET_PER_RENDER):
+        self.lock = threading.Lock()
+        self.left = retries
+
+    def take(self):
+        with self.lock:
+            if self.left <= 0:
+                return False
+            self.left -= 1
+            return True
+
+def in_background_thread():
+    """True when called outside a page render (poller, cache refresh, breaker trials)"""
+    return get_script_run_ctx(suppress_warning=True) is None
+
+def get_retry_budget():
+    """The current render's retry budget; background work has none"""
+    if in_background_thread():
+        return None
+    return st.session_state.get("retry_budget")
+
+class RequestAttempts:
+    """Retry, geo-block, proxy and breaker rules shared by smart_request and smart_request_async.
+
+    The two loops only differ in how they send the GET; every decision is made here.
+    """
+
+    def __init__(self, url, max_retries=3, background=False, retry_budget=None):
+        self.url = url
+        self.max_retries = max_retries
+        self.retry_budget = retry_budget
+        self.allowed = HOST_BREAKERS.allow(url, background)  # known-bad host: fail fast
+        self.host_reachable = False
+        self.retries = 0
+
+    @property
+    def use_proxy(self):
+        # First try without proxy, use proxy for subsequent attempts
+        return self.retries > 0
+
+    def next(self):
+        """True while another attempt may go out"""
+        if not self.allowed or self.retries >= self.max_retries:
+            return False
+        if self.use_proxy and self.retry_budget and not self.retry_budget.take():
+            return False  # This render has spent its retries
+        return True
+
+    def accept(self, status_code, content):
+        """True if the response should be returned; otherwise schedule the next attempt"""
+        self.host_reachable = self.host_reachable or status_code < 500
+        # Conditional GET hit - nothing changed upstream, there is no body to check
+        if status_code == 304:
+            HOST_BREAKERS.record(self.url, True)
+            return True
+        geo_blocked = is_geo_blocked(content, self.url)
+        if status_code == 200 and not geo_blocked:
+            HOST_BREAKERS.record(self.url, True)
+            return True
+        # If geo-blocked, force proxy usage next time
+        if geo_blocked and self.retries == 0:
+            self.retries = self.max_retries - 1  # Immediately try with proxy
+        else:
+            self.retries += 1
+        return False
+
+    def failed(self):
+        self.retries += 1
+
+    def give_up(self):
+        # A 4xx or geo-block means the host is up; only connection errors and 5xx trip the breaker
+        if self.allowed:
+            HOST_BREAKERS.record(self.url, self.host_reachable)
+        return None
+
+# =============== Async Networking ===============
+ASYNC_CONNECTION_LIMIT = 200
+ASYNC_CONNECTIONS_PER_HOST = 8
+
+class AsyncResponse:
+    """The parts of requests.Response our callers use, filled in from aiohttp"""
+
+    def __init__(self, url, status_code, headers, content, encoding=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+class AsyncHttpRunner:
+    """Event loop on a daemon thread with one shared aiohttp session"""
+
+    def __init__(self, limit=ASYNC_CONNECTION_LIMIT, limit_per_host=ASYNC_CONNECTIONS_PER_HOST):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="lews-async-http", daemon=True)
+        self.thread.start()
+        self.session = self.run(self._create_session(limit, limit_per_host))
+
+    async def _create_session(self, limit, limit_per_host):
+        connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host)
+        # Shared by every host and viewer, like HTTP_SESSIONS; keep no cookies between requests
+        return aiohttp.ClientSession(connector=connector, cookie_jar=aiohttp.DummyCookieJar())
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the loop from any thread and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+@st.cache_resource(show_spinner=False)
+def get_async_http():
+    """Start the shared event loop once per process"""
+    return AsyncHttpRunner()
+
+ASYNC_HTTP = get_async_http()
+
+async def smart_request_async(url, max_retries=3, timeout=5, headers=None, proxy_provider=None,
+                              background=True, retry_budget=None):
+    """asyncio counterpart of smart_request, on the shared aiohttp session"""
+    attempts = RequestAttempts(url, max_retries, background, retry_budget)
+    proxy_provider = proxy_provider or get_best_proxy
+    headers = {"User-Agent": "Mozilla/5.0", **(headers or {})}
+    # Like requests: connect/read timeouts, so waiting for a pooled connection doesn't count
+    client_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+    while attempts.next():
+        proxies = None
         try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                proxies.extend([p.strip() for p in response.text.split('\n') if p.strip()])
+            if attempts.use_proxy:
+                proxies = await asyncio.to_thread(proxy_provider)
+            start = time.time()
+            async with ASYNC_HTTP.session.get(url, headers=headers,
+                                              proxy=proxies["http"] if proxies else None,
+                                              timeout=client_timeout) as resp:
+                response = AsyncResponse(str(resp.url), resp.status, resp.headers,
+                                         await resp.read(), resp.charset)
+            release_proxy(proxies, True, time.time() - start)
         except Exception:
+            release_proxy(proxies, False)
+            attempts.failed()
             continue
-    return list(set(proxies))  # Remove duplicates
+        if attempts.accept(response.status_code, response.content):
+            return response
+    return attempts.give_up()
+
+def smart_request_many(urls, max_retries=3, timeout=5, headers=None):
+    """Fan out smart_request_async over many URLs on one thread; returns {url: response or None}"""
+    urls = list(dict.fromkeys(urls))
+    background = in_background_thread()
+    retry_budget = get_retry_budget()
 
-def test_proxy(proxy, test_url="https://ipinfo.io/json", timeout=3):
-    """Test if a proxy is working"""
+    async def gather():
+        return await asyncio.gather(*(
+            smart_request_async(url, max_retries, timeout, headers,
+                                background=background, retry_budget=retry_budget)
+            for url in urls
+        ), return_exceptions=True)
+
+    results = ASYNC_HTTP.run(gather())
+    return {url: (None if isinstance(result, Exception) else result)
+            for url, result in zip(urls, results)}
+
+async def test_proxy_async(proxy, test_url="https://ipinfo.io/json", timeout=3):
+    """Probe one proxy; returns (success, latency)"""
     try:
-        proxies = {"http": f"http://{proxy}", "https": f"http://{proxy}"}
         start = time.time()
-        response = requests.get(test_url, proxies=proxies, timeout=timeout)
+        async with ASYNC_HTTP.session.get(test_url, proxy=f"http://{proxy}",
+                                          timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+            data = await resp.json(content_type=None)
         latency = time.time() - start
-        if response.status_code == 200 and "ip" in response.json():
+        if resp.status == 200 and "ip" in data:
             return True, latency
     except Exception:
         pass
     return False, None
 
+def test_proxies(proxies, test_url="https://ipinfo.io/json", timeout=3):
+    """Test many proxies concurrently; returns [(success, latency)] in input order"""
+    async def gather():
+        return await asyncio.gather(*(test_proxy_async(proxy, test_url, timeout) for proxy in proxies))
+    return ASYNC_HTTP.run(gather())
+
+async def fetch_proxy_list_async():
+    async def fetch(url):
+        try:
+            async with ASYNC_HTTP.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                if resp.status == 200:
+                    text = await resp.text(errors="replace")
+                    return [p.strip() for p in text.split('\n') if p.strip()]
+        except Exception:
+            pass
+        return []
+
+    proxies = []
+    for found in await asyncio.gather(*(fetch(url) for url in PROXY_PROVIDERS)):
+        proxies.extend(found)
+    return list(set(proxies))  # Remove duplicates
+
+# =============== Proxy Management ===============
+PROXY_PROVIDERS = [
+    "https://api.proxyscrape.com/v2/?request=getproxies&protocol=http&timeout=10000&country=all",
+    "https://api.proxyscrape.com/?request=displayproxies&protocol=http&timeout=10000&country=all",
+    "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/http.txt"
+]
+
+PROXY_REFRESH_INTERVAL = 600   # seconds between provider list refreshes
+PROXY_PROBE_BATCH = 20
+PROXY_POOL_TARGET = 20         # keep probing new candidates until this many are healthy
+PROXY_CHECK_INTERVAL = 30      # health checker cycle
+PROXY_RECHECK_INTERVAL = 120   # re-probe idle pooled proxies this often
+PROXY_MAX_LEASES = 4           # concurrent requests allowed through one proxy
+PROXY_LATENCY_SAMPLES = 20     # samples kept for latency percentiles
+PROXY_MIN_SCORE = 0.3          # proxies scoring below this (after a few uses) are evicted
+PROXY_MAX_CONSECUTIVE_FAILURES = 3
+
+def fetch_proxy_list():
+    """Fetch proxies from multiple providers"""
+    return ASYNC_HTTP.run(fetch_proxy_list_async())
+
+def latency_percentile(samples, pct):
+    if not samples:
+        return float("inf")
+    ordered = sorted(samples)
+    return ordered[min(int(pct / 100 * len(ordered)), len(ordered) - 1)]
+
+class ProxyPool:
+    """Process-wide proxy pool shared by every browser session.
+
+    A background health checker keeps probing candidates from
+    fetch_proxy_list(), re-probes pooled proxies and evicts failing ones.
+    Proxies are kept ranked by success rate, then p90 latency, so lease()
+    hands out the best available proxy without any network round trip.
+    Leased proxies go back into the pool on release() with the outcome.
+    """
+
+    def __init__(self, refresh_interval=PROXY_REFRESH_INTERVAL, probe_batch=PROXY_PROBE_BATCH,
+                 max_leases=PROXY_MAX_LEASES, target_size=PROXY_POOL_TARGET,
+                 start_checker=True):
+        self.refresh_interval = refresh_interval
+        self.probe_batch = probe_batch
+        self.max_leases = max_leases
+        self.target_size = target_size
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.candidates = []
+        self.index = 0
+        self.last_refresh = 0
+        self.health = {}  # proxy -> health dict, see _new_health
+        self.ranked = []  # healthy proxies, best first
+        if start_checker:
+            self.thread = threading.Thread(target=self._run, name="lews-proxy-checker", daemon=True)
+            self.thread.start()
+
+    @staticmethod
+    def _new_health():
+        return {"successes": 0, "failures": 0, "consecutive_failures": 0,
+                "latencies": deque(maxlen=PROXY_LATENCY_SAMPLES),
+                "leases": 0, "last_checked": 0}
+
+    @staticmethod
+    def score(health):
+        # Laplace-smoothed success rate, so a fresh proxy starts at 0.5-ish
+        return (health["successes"] + 1) / (health["successes"] + health["failures"] + 2)
+
+    def lease(self):
+        """Return the best-ranked proxy ("host:port") with spare capacity, or None"""
+        with self.lock:
+            for proxy in self.ranked:
+                health = self.health[proxy]
+                if health["leases"] < self.max_leases:
+                    health["leases"] += 1
+                    return proxy
+        self.wakeup.set()  # pool is dry, let the checker probe now
+        return None
+
+    def release(self, proxy, success, latency=None):
+        """Return a leased proxy to the pool with the outcome of its request"""
+        with self.lock:
+            health = self.health.get(proxy)
+            if health is None:
+                return  # evicted while leased
+            health["leases"] = max(health["leases"] - 1, 0)
+            self._record(proxy, health, success, latency)
+
+    def force_refresh(self):
+        with self.lock:
+            self.last_refresh = 0
+        self.wakeup.set()
+
+    def status(self):
+        with self.lock:
+            best = self.health[self.ranked[0]] if self.ranked else None
+            return {
+                "total_proxies": len(self.candidates),
+                "working_proxies": len(self.health),
+                "leased": sum(h["leases"] for h in self.health.values()),
+                "best_success_rate": round(self.score(best), 2) if best else None,
+                "best_latency_p50": round(latency_percentile(best["latencies"], 50), 3) if best else None,
+                "best_latency_p90": round(latency_percentile(best["latencies"], 90), 3) if best else None,
+                "last_refresh": self.last_refresh,
+            }
+
+    def _record(self, proxy, health, success, latency):
+        # Caller holds self.lock
+        health["last_checked"] = time.time()
+        if success:
+            health["successes"] += 1
+            health["consecutive_failures"] = 0
+            if latency is not None:
+                health["latencies"].append(latency)
+        else:
+            health["failures"] += 1
+            health["consecutive_failures"] += 1
+        attempts = health["successes"] + health["failures"]
+        if (health["consecutive_failures"] >= PROXY_MAX_CONSECUTIVE_FAILURES
+                or (attempts >= 5 and self.score(health) < PROXY_MIN_SCORE)):
+            del self.health[proxy]
+        self._rerank()
+
+    def _rerank(self):
+        # Caller holds self.lock
+        self.ranked = sorted(
+            self.health,
+            key=lambda p: (-self.score(self.health[p]), latency_percentile(self.health[p]["latencies"], 90)),
+        )
+
+    def _refresh_if_due(self):
+        if time.time() - self.last_refresh <= self.refresh_interval:
+            return
+        candidates = fetch_proxy_list()
+        with self.lock:
+            self.candidates = candidates
+            self.index = 0
+            kept = set(candidates)
+            self.health = {p: h for p, h in self.health.items() if p in kept or h["leases"]}
+            self.last_refresh = time.time()
+            self._rerank()
+
+    def _probe(self, proxies):
+        results = test_proxies(proxies)
+        with self.lock:
+            for proxy, (success, latency) in zip(proxies, results):
+                health = self.health.get(proxy)
+                if health is None:
+                    if not success:
+                        continue
+                    health = self.health[proxy] = self._new_health()
+                self._record(proxy, health, success, latency)
+
+    def check_once(self):
+        """One health-check cycle: refresh the list, re-probe idle proxies, top up the pool"""
+        self._refresh_if_due()
+        now = time.time()
+        with self.lock:
+            stale = [p for p, h in self.health.items()
+                     if h["leases"] == 0 and now - h["last_checked"] > PROXY_RECHECK_INTERVAL]
+            batch = []
+            if len(self.health) < self.target_size and self.candidates:
+                if self.index >= len(self.candidates):
+                    self.index = 0  # start another pass over the list
+                batch = [p for p in self.candidates[self.index:self.index + self.probe_batch]
+                         if p not in self.health]
+                self.index += self.probe_batch
+        if stale or batch:
+            self._probe(stale + batch)
+
+    def _run(self):
+        while True:
+            self.wakeup.clear()
+            try:
+                self.check_once()
+            except Exception:
+                pass  # keep checking; a provider outage must not kill the thread
+            with self.lock:
+                dry = len(self.health) < self.target_size and self.index < len(self.candidates)
+            # Probe back-to-back while the pool is below target and this pass has candidates left
+            self.wakeup.wait(timeout=1 if dry else PROXY_CHECK_INTERVAL)
+
+@st.cache_resource(show_spinner=False)
+def get_proxy_pool():
+    """Create the shared proxy pool once per process"""
+    return ProxyPool()
+
+PROXY_POOL = get_proxy_pool()
+
 def get_best_proxy():
-    """Get the fastest working proxy with automatic rotation"""
-    if "proxy_cache" not in st.session_state:
-        st.session_state.proxy_cache = {
-            "proxies": [],
-            "index": 0,
-            "last_refresh": 0,
-            "working_proxies": []
-        }
-    
-    # Refresh proxy list every 10 minutes
-    if time.time() - st.session_state.proxy_cache["last_refresh"] > 600:
-        st.session_state.proxy_cache["proxies"] = fetch_proxy_list()
-        st.session_state.proxy_cache["index"] = 0
-        st.session_state.proxy_cache["working_proxies"] = []
-        st.session_state.proxy_cache["last_refresh"] = time.time()
-    
-    # Find working proxies if none available
-    if not st.session_state.proxy_cache["working_proxies"]:
-        proxies = st.session_state.proxy_cache["proxies"][st.session_state.proxy_cache["index"]:st.session_state.proxy_cache["index"]+20]
-        if not proxies:
-            return None  # No proxies available
-        
-        # Test proxies in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(test_proxy, proxies))
-        
-        # Collect working proxies with their latencies
-        working = []
-        for i, (success, latency) in enumerate(results):
-            if success:
-                working.append((proxies[i], latency))
-        
-        # Sort by latency (fastest first)
-        working.sort(key=lambda x: x[1])
-        st.session_state.proxy_cache["working_proxies"] = [p[0] for p in working]
-        st.session_state.proxy_cache["index"] += 20
-    
-    # Return next proxy in rotation
-    if st.session_state.proxy_cache["working_proxies"]:
-        proxy = st.session_state.proxy_cache["working_proxies"].pop(0)
+    """Lease the best-ranked proxy from the shared pool; hand it back with release_proxy"""
+    proxy = PROXY_POOL.lease()
+    if proxy:
         return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
     return None
 
-def smart_request(url, max_retries=3, timeout=5):
+def release_proxy(proxies, success, latency=None):
+    if proxies:
+        PROXY_POOL.release(proxies["http"].removeprefix("http://"), success, latency)
+
+GEO_BLOCK_TERMS = ["geoblocked", "not available in your region",
+                   "content restricted", "geo-restricted"]
+GEO_BLOCK_SCAN_BYTES = 64 * 1024  # block pages say so up front; don't scan whole feeds/result pages
+GEO_BLOCK_SKIP_HOSTS = {"api.open-meteo.com", "ipinfo.io", "noembed.com"}  # JSON APIs
+
+def compile_geo_block_matcher(terms):
+    """Lower-cased byte needles; bytes `in` over a lowered prefix beats a re.IGNORECASE alternation"""
+    return tuple(term.lower().encode() for term in terms)
+
+GEO_BLOCK_MATCHER = compile_geo_block_matcher(GEO_BLOCK_TERMS)
+
+def is_geo_blocked(content, url=None, scan_bytes=GEO_BLOCK_SCAN_BYTES, matcher=GEO_BLOCK_MATCHER):
+    """Look for geo-block phrases in the first scan_bytes of the raw body, without decoding it"""
+    if url and urllib.parse.urlparse(url).hostname in GEO_BLOCK_SKIP_HOSTS:
+        return False
+    if not content:
+        return False
+    head = content[:scan_bytes].lower()
+    return any(term in head for term in matcher)
+
+def smart_request(url, max_retries=3, timeout=5, headers=None):
     """Make requests with automatic proxy rotation and geo-bypass"""
-    headers = {"User-Agent": "Mozilla/5.0"}
-    retries = 0
-    
-    while retries < max_retries:
+    attempts = RequestAttempts(url, max_retries, in_background_thread(), get_retry_budget())
+    headers = {"User-Agent": "Mozilla/5.0", **(headers or {})}
+
+    while attempts.next():
+        proxies = None
         try:
-            # First try without proxy
-            if retries == 0:
-                response = requests.get(url, headers=headers, timeout=timeout)
-            else:
-                # Use proxy for subsequent attempts
+            if attempts.use_proxy:
                 proxies = get_best_proxy()
-                if proxies:
-                    response = requests.get(url, headers=headers, 
-                                          proxies=proxies, timeout=timeout)
-                else:
-                    response = requests.get(url, headers=headers, timeout=timeout)
-            
-            # Check for geo-block indicators
-            content = response.text.lower()
-            geo_blocked = any(term in content for term in 
-                             ["geoblocked", "not available in your region", 
-                              "content restricted", "geo-restricted"])
-            
-            if response.status_code == 200 and not geo_blocked:
-                return response
-            
-            # If geo-blocked, force proxy usage next time
-            if geo_blocked and retries == 0:
-                retries = max_retries - 1  # Immediately try with proxy
-            else:
-                retries += 1
-                
-        except Exception as e:
-            retries += 1
-    
-    return None
+            start = time.time()
+            response = HTTP_SESSIONS.get(url, headers=headers, proxies=proxies, timeout=timeout)
+            # The proxy relayed a response, whatever its status
+            release_proxy(proxies, True, time.time() - start)
+        except Exception:
+            release_proxy(proxies, False)
+            attempts.failed()
+            continue
+        if attempts.accept(response.status_code, response.content):
+            return response
+    return attempts.give_up()
 
-# =============== Helpers ===============
+# =============== Persistent Cache ===============
+CACHE_DIR = os.environ.get("LEWS_CACHE_DIR", ".lews_cache")
+CACHE_MAX_BYTES = int(os.environ.get("LEWS_CACHE_MAX_BYTES", 200 * 1024 * 1024))
+
+class DiskCache:
+    """SQLite-backed cache with TTLs, LRU size eviction and a stale window.
+
+    get() reports whether a value is still fresh; callers that serve stale
+    values schedule their own refresh (FeedPoller, ForecastStore, YouTube previews).
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(os.path.join(cache_dir, "cache.sqlite3"), check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fresh_until REAL NOT NULL,
+                stale_until REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.db.commit()
+
+    def get(self, key):
+        """Return (value, is_fresh); (None, False) when missing or past its stale window"""
+        now = time.time()
+        with self.lock:
+            row = self.db.execute(
+                "SELECT value, fresh_until, stale_until FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None, False
+            value, fresh_until, stale_until = row
+            if now > stale_until:
+                self.db.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.db.commit()
+                return None, False
+            self.db.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self.db.commit()
+        try:
+            return pickle.loads(value), now <= fresh_until
+        except Exception:
+            return None, False
+
+    def set(self, key, value, ttl, stale_ttl=0):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now + ttl, now + ttl + stale_ttl, now),
+            )
+            self._evict()
+            self.db.commit()
+
+    def _evict(self):
+        # Drop least recently used rows until we are back under 90% of the budget
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        for key, size in self.db.execute(
+            "SELECT key, size FROM cache ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= target:
+                break
+            self.db.execute("DELETE FROM cache WHERE key = ?", (key,))
+            total -= size
+
+
+@st.cache_resource(show_spinner=False)
+def get_disk_cache():
+    """Open the persistent cache once per process"""
+    return DiskCache()
+
+def disk_cache_key(namespace, *args):
+    return f"{namespace}:{json.dumps(args)}"
+
+# =============== Feeds Catalog ===============
 
 def detect_encoding(file_path):
     with open(file_path, "rb") as f:
         result = chardet.detect(f.read(100_000))
         return result['encoding']
 
-def get_ip_location():
-    """Always return a tuple with 5 values - fallback to Hamburg, Germany"""
+# Spreadsheet XML namespaces
+ODS_TABLE_NS = "urn:oasis:names:tc:opendocument:xmlns:table:1.0"
+ODS_OFFICE_NS = "urn:oasis:names:tc:opendocument:xmlns:office:1.0"
+ODS_TEXT_NS = "urn:oasis:names:tc:opendocument:xmlns:text:1.0"
+XLSX_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+XLSX_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+XLSX_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+ODS_MIMETYPE = b"application/vnd.oasis.opendocument.spreadsheet"
+
+CATALOG_COLUMNS = ["city", "country", "category", "name", "url", "lat", "lon"]
+CATALOG_REQUIRED_COLUMNS = ["city", "country", "category", "name", "url"]
+
+def sniff_catalog_format(path):
+    """Detect the real catalog format from magic bytes: "ods", "xlsx", "tsv" or "csv" """
+    with open(path, "rb") as f:
+        head = f.read(64 * 1024)
+    if head.startswith(b"PK\x03\x04"):
+        with zipfile.ZipFile(path) as zf:
+            names = set(zf.namelist())
+            if "mimetype" in names and zf.read("mimetype").strip() == ODS_MIMETYPE:
+                return "ods"
+            if "xl/workbook.xml" in names:
+                return "xlsx"
+        raise ValueError("Unsupported ZIP-based catalog (expected .ods or .xlsx)")
+    if head.startswith(b"\xd0\xcf\x11\xe0"):
+        raise ValueError("Legacy .xls workbooks are not supported, save the catalog as .xlsx or .ods")
+    first_line = head.split(b"\n", 1)[0]
+    return "tsv" if b"\t" in first_line else "csv"
+
+def iter_ods_rows(path):
+    """Stream the first sheet of an OpenDocument spreadsheet as lists of cell strings"""
+    row_tag = f"{{{ODS_TABLE_NS}}}table-row"
+    table_tag = f"{{{ODS_TABLE_NS}}}table"
+    cell_tags = {f"{{{ODS_TABLE_NS}}}table-cell", f"{{{ODS_TABLE_NS}}}covered-table-cell"}
+    cols_repeated = f"{{{ODS_TABLE_NS}}}number-columns-repeated"
+    rows_repeated = f"{{{ODS_TABLE_NS}}}number-rows-repeated"
+    value_type = f"{{{ODS_OFFICE_NS}}}value-type"
+    text_p = f"{{{ODS_TEXT_NS}}}p"
+    typed_value = {
+        "float": f"{{{ODS_OFFICE_NS}}}value",
+        "percentage": f"{{{ODS_OFFICE_NS}}}value",
+        "currency": f"{{{ODS_OFFICE_NS}}}value",
+        "date": f"{{{ODS_OFFICE_NS}}}date-value",
+        "time": f"{{{ODS_OFFICE_NS}}}time-value",
+        "boolean": f"{{{ODS_OFFICE_NS}}}boolean-value",
+    }
+
+    with zipfile.ZipFile(path) as zf, zf.open("content.xml") as f:
+        for _, elem in etree.iterparse(f, events=("end",), tag=(row_tag, table_tag)):
+            if elem.tag == table_tag:
+                return  # Only the first sheet
+            row = []
+            pending_empty = 0  # trailing empty cells are often repeated ~1000x; only pad when needed
+            for cell in elem:
+                if cell.tag not in cell_tags:
+                    continue
+                attr = typed_value.get(cell.get(value_type))
+                if attr:
+                    value = cell.get(attr, "")
+                else:
+                    value = "\n".join("".join(p.itertext()) for p in cell.iter(text_p))
+                repeat = int(cell.get(cols_repeated, 1))
+                if value:
+                    row.extend([""] * pending_empty)
+                    pending_empty = 0
+                    row.extend([value] * repeat)
+                else:
+                    pending_empty += repeat
+            if any(row):
+                for _ in range(int(elem.get(rows_repeated, 1))):
+                    yield row
+            # Free what we've parsed so memory stays flat on large sheets
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+def xlsx_first_sheet_path(zf):
+    workbook = etree.fromstring(zf.read("xl/workbook.xml"))
+    sheet = workbook.find(f"{{{XLSX_MAIN_NS}}}sheets/{{{XLSX_MAIN_NS}}}sheet")
+    if sheet is None:
+        raise ValueError("Workbook has no sheets")
+    rel_id = sheet.get(f"{{{XLSX_REL_NS}}}id")
+    rels = etree.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    for rel in rels.iter(f"{{{XLSX_PKG_REL_NS}}}Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target")
+            return target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+    return "xl/worksheets/sheet1.xml"
+
+def xlsx_column_index(ref):
+    """"C7" -> 2"""
+    index = 0
+    for ch in ref:
+        if not ch.isalpha():
+            break
+        index = index * 26 + (ord(ch.upper()) - 64)
+    return index - 1
+
+def iter_xlsx_rows(path):
+    """Stream the first sheet of an Office Open XML workbook as lists of cell strings"""
+    row_tag = f"{{{XLSX_MAIN_NS}}}row"
+    cell_tag = f"{{{XLSX_MAIN_NS}}}c"
+    value_tag = f"{{{XLSX_MAIN_NS}}}v"
+    text_tag = f"{{{XLSX_MAIN_NS}}}t"
+
+    with zipfile.ZipFile(path) as zf:
+        shared = []
+        if "xl/sharedStrings.xml" in zf.namelist():
+            with zf.open("xl/sharedStrings.xml") as f:
+                for _, si in etree.iterparse(f, events=("end",), tag=f"{{{XLSX_MAIN_NS}}}si"):
+                    shared.append("".join(t.text or "" for t in si.iter(text_tag)))
+                    si.clear()
+        with zf.open(xlsx_first_sheet_path(zf)) as f:
+            for _, elem in etree.iterparse(f, events=("end",), tag=row_tag):
+                row = []
+                for cell in elem.iter(cell_tag):
+                    ref = cell.get("r")
+                    col = xlsx_column_index(ref) if ref else len(row)
+                    kind = cell.get("t")
+                    if kind == "inlineStr":
+                        value = "".join(t.text or "" for t in cell.iter(text_tag))
+                    else:
+                        value = cell.findtext(value_tag) or ""
+                        if kind == "s" and value:
+                            value = shared[int(value)]
+                    if col >= len(row):
+                        row.extend([""] * (col - len(row) + 1))
+                    row[col] = value
+                if any(row):
+                    yield row
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+def iter_delimited_rows(path, delimiter):
+    """Stream a CSV/TSV file as lists of cell strings"""
+    encoding = detect_encoding(path) or "utf-8"
+    with open(path, newline="", encoding=encoding, errors="replace") as f:
+        for row in csv.reader(f, delimiter=delimiter):
+            if any(cell.strip() for cell in row):
+                yield row
+
+def iter_catalog_rows(path):
+    """Stream rows (header first) from an ODS, XLSX, TSV or CSV catalog"""
+    fmt = sniff_catalog_format(path)
+    if fmt == "ods":
+        return iter_ods_rows(path)
+    if fmt == "xlsx":
+        return iter_xlsx_rows(path)
+    return iter_delimited_rows(path, "\t" if fmt == "tsv" else ",")
+
+def load_feeds_csv(csv_path):
+    """Load and validate the feeds catalog (raises ValueError on a missing column).
+
+    Despite the name this reads ODS, XLSX, TSV and CSV; rows are streamed and
+    only the catalog columns are kept.
+    """
+    rows = iter_catalog_rows(csv_path)
+    header = [str(col).strip() for col in next(rows, [])]
+    for col in CATALOG_REQUIRED_COLUMNS:
+        if col not in header:
+            raise ValueError(f"CSV must include column: {col}")
+    keep = [(col, header.index(col)) for col in CATALOG_COLUMNS if col in header]
+    records = (
+        [(row[i].strip() or None) if i < len(row) else None for _, i in keep]
+        for row in rows
+    )
+    df = pd.DataFrame.from_records(records, columns=[col for col, _ in keep])
+    for col in ("lat", "lon"):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+        else:
+            df[col] = float("nan")
+    return df
+
+CATALOG_CACHE_SUFFIX = ".catalog.pkl"
+CATALOG_CACHE_VERSION = 2                 # bumped when build_feeds_catalog's output changes
+CATALOG_JOURNAL_SUFFIX = ".journal.tsv"   # feeds added from the UI, appended one row at a time
+CATALOG_LOCK_SUFFIX = ".catalog.lock"
+CATALOG_JOURNAL_COMPACT_BYTES = 8 * 1024  # fold the journal into a CSV/TSV catalog past this size (~64 rows)
+CATALOG_WRITE_LOCK = threading.Lock()     # flock is per open file, so serialize threads too
+
+@contextmanager
+def catalog_write_lock(csv_path):
+    """Exclusive lock for catalog writers, across threads and (where supported) processes"""
+    with CATALOG_WRITE_LOCK, open(csv_path + CATALOG_LOCK_SUFFIX, "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def iter_journal_rows(journal_path):
+    """Rows appended by append_feed(), in CATALOG_COLUMNS order"""
+    try:
+        with open(journal_path, newline="", encoding="utf-8") as f:
+            for row in csv.reader(f, delimiter="\t"):
+                if len(row) == len(CATALOG_COLUMNS):
+                    yield row
+    except FileNotFoundError:
+        return
+
+def load_feeds_with_journal(csv_path):
+    """The catalog file plus any feeds still sitting in its journal"""
+    df = load_feeds_csv(csv_path) if os.path.exists(csv_path) else pd.DataFrame(columns=CATALOG_COLUMNS)
+    journal = pd.DataFrame.from_records(
+        ([cell or None for cell in row] for row in iter_journal_rows(csv_path + CATALOG_JOURNAL_SUFFIX)),
+        columns=CATALOG_COLUMNS,
+    )
+    if journal.empty:
+        return df
+    for col in ("lat", "lon"):
+        journal[col] = pd.to_numeric(journal[col], errors="coerce")
+    return pd.concat([df, journal], ignore_index=True)
+
+def catalog_signature(csv_path):
+    """(mtime_ns, size) of the catalog file and of its journal; changes whenever either is written"""
+    parts = []
+    for path in (csv_path, csv_path + CATALOG_JOURNAL_SUFFIX):
+        try:
+            stat = os.stat(path)
+            parts.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            parts.append(None)
+    return tuple(parts)
+
+def is_text_catalog(path):
+    """True for CSV/TSV catalogs, the only kind compact_feeds_journal() rewrites; reads 4 bytes"""
+    try:
+        with open(path, "rb") as f:
+            return not f.read(4).startswith((b"PK\x03\x04", b"\xd0\xcf\x11\xe0"))
+    except FileNotFoundError:
+        return False
+
+def append_feed(csv_path, row):
+    """Append one feed to the catalog journal (O(1) I/O), compacting text catalogs when it grows.
+
+    `row` maps CATALOG_COLUMNS to values. Readers pick the feed up through
+    catalog_signature(), so no cache has to be cleared by hand.
+    """
+    journal_path = csv_path + CATALOG_JOURNAL_SUFFIX
+    line = io.StringIO()
+    csv.writer(line, delimiter="\t", lineterminator="\n").writerow(
+        ["" if row.get(col) is None else str(row[col]).replace("\t", " ").replace("\n", " ")
+         for col in CATALOG_COLUMNS]
+    )
+    data = line.getvalue().encode("utf-8")
+    with catalog_write_lock(csv_path):
+        fd = os.open(journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+            pending_bytes = os.fstat(fd).st_size  # size stands in for the row count; no re-read
+        finally:
+            os.close(fd)
+        # Spreadsheet journals are never folded in, so don't even try for them
+        if pending_bytes >= CATALOG_JOURNAL_COMPACT_BYTES and is_text_catalog(csv_path):
+            compact_feeds_journal(csv_path)
+
+def compact_feeds_journal(csv_path):
+    """Fold journal rows into a CSV/TSV catalog via copy + append + atomic rename.
+
+    Caller must hold catalog_write_lock(). Spreadsheet catalogs (ODS/XLSX)
+    are never rewritten; their journal simply stays alongside them.
+    """
+    journal_path = csv_path + CATALOG_JOURNAL_SUFFIX
+    rows = list(iter_journal_rows(journal_path))
+    if not rows or not os.path.exists(csv_path):
+        return False
+    fmt = sniff_catalog_format(csv_path)
+    if fmt not in ("csv", "tsv"):
+        return False
+
+    delimiter = "\t" if fmt == "tsv" else ","
+    encoding = detect_encoding(csv_path) or "utf-8"
+    if encoding.lower() == "ascii":
+        encoding = "utf-8"
+    with open(csv_path, newline="", encoding=encoding, errors="replace") as f:
+        header = [col.strip() for col in next(csv.reader(f, delimiter=delimiter), [])]
+    needs_newline = False
+    if os.path.getsize(csv_path):
+        with open(csv_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+
+    tmp_path = f"{csv_path}.{os.getpid()}.tmp"
+    try:
+        shutil.copyfile(csv_path, tmp_path)
+        with open(tmp_path, "a", newline="", encoding=encoding, errors="replace") as f:
+            if needs_newline:
+                f.write("\n")
+            writer = csv.writer(f, delimiter=delimiter, lineterminator="\n")
+            for journal_row in rows:
+                values = dict(zip(CATALOG_COLUMNS, journal_row))
+                writer.writerow([values.get(col, "") for col in header])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, csv_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    # Only now is it safe to drop the journal: every row is in the catalog
+    with open(journal_path, "w", encoding="utf-8"):
+        pass
+    return True
+
+def catalog_locations(df):
+    """{city: (lat, lon, tz name)} from each city's first row, for cities with valid coordinates"""
+    first = df.drop_duplicates("city")
+    lats = pd.to_numeric(first["lat"], errors="coerce")
+    lons = pd.to_numeric(first["lon"], errors="coerce")
+    valid = first["city"].notna() & lats.between(-90, 90) & lons.between(-180, 180)
+    return {
+        city: (lat, lon, get_timezone(lat, lon))
+        for city, lat, lon in zip(first["city"][valid], lats[valid].tolist(), lons[valid].tolist())
+    }
+
+def build_feeds_catalog(df):
+    """Index a loaded catalog: sorted city list, a city -> feeds DataFrame map and city locations"""
+    by_city = {city: group for city, group in df.groupby("city", sort=True)}
+    return {"df": df, "cities": list(by_city), "by_city": by_city, "locations": catalog_locations(df)}
+
+def load_feeds_catalog(csv_path):
+    """Load the feeds catalog, reusing the compiled form while the file and its journal are unchanged"""
+    return load_compiled_catalog(os.path.abspath(csv_path), catalog_signature(csv_path))
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def load_compiled_catalog(path, file_signature):
+    """Catalog keyed on path + catalog_signature(), with a pickled copy kept next to the source file.
+
+    The returned catalog is shared across sessions and must not be mutated.
+    """
+    signature = (CATALOG_CACHE_VERSION, path, file_signature)
+    sidecar = path + CATALOG_CACHE_SUFFIX
+    try:
+        with open(sidecar, "rb") as f:
+            compiled = pickle.load(f)
+        if compiled.get("signature") == signature:
+            return compiled["catalog"]
+    except Exception:
+        pass  # Missing, stale or unreadable - rebuild below
+
+    catalog = build_feeds_catalog(load_feeds_with_journal(path))
+    try:
+        tmp_path = f"{sidecar}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"signature": signature, "catalog": catalog}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        pass  # Read-only checkout; the in-process cache still applies
+    return catalog
+
+# =============== Helpers ===============
+IP_LOCATION_FALLBACK = ("Hamburg", "BE", "DE", 52.52, 13.405)
+IP_LOCATION_TTL = 3600          # seconds
+IP_LOCATION_FAILURE_TTL = 300   # retry sooner when ipinfo.io was unreachable
+
+def lookup_ip_location():
+    """Blocking ipinfo.io lookup; returns (city, region, country, lat, lon) or None"""
     try:
         response = smart_request("https://ipinfo.io/json", timeout=5)
         if response and response.status_code == 200:
@@ -190,16 +1186,82 @@ def get_ip_location():
                     lat, lon = 52.52, 13.405
                 return city, region, country, lat, lon
             except:
-                return "Hamburg", "BE", "DE", 52.52, 13.405
+                return IP_LOCATION_FALLBACK
     except Exception:
         pass
+    return None
+
+class IpLocationCache:
+    """TTL cache for the server's IP geolocation, looked up off the render path"""
+
+    def __init__(self, ttl=IP_LOCATION_TTL, failure_ttl=IP_LOCATION_FAILURE_TTL):
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.lock = threading.Lock()
+        self.location = None
+        self.expires = 0
+        self.pending = False
+
+    def get(self):
+        """Return the cached location (or None) right away; start a lookup if it's missing or expired"""
+        with self.lock:
+            location = self.location
+            start_lookup = time.time() >= self.expires and not self.pending
+            if start_lookup:
+                self.pending = True
+        if start_lookup:
+            threading.Thread(target=self._lookup, name="lews-ip-location", daemon=True).start()
+        return location
+
+    def _lookup(self):
+        location = lookup_ip_location()
+        with self.lock:
+            if location:
+                self.location = location
+            self.expires = time.time() + (self.ttl if location else self.failure_ttl)
+            self.pending = False
+
+@st.cache_resource(show_spinner=False)
+def get_ip_location_cache():
+    """Create the shared IP location cache once per process"""
+    return IpLocationCache()
+
+def get_ip_location():
+    """Always return a tuple with 5 values - fallback to Hamburg, Germany.
+
+    Resolved at most once per session; until the background lookup finishes
+    the Hamburg defaults are returned so the page never waits on ipinfo.io.
+    """
+    if "ip_location" in st.session_state:
+        return st.session_state.ip_location
+    location = get_ip_location_cache().get()
+    if location:
+        st.session_state.ip_location = location
+        return location
     # Fallback to Hamburg, Germany coordinates
-    return "Hamburg", "BE", "DE", 52.52, 13.405
+    return IP_LOCATION_FALLBACK
+
+TIMEZONE_FINDER_IN_MEMORY = os.environ.get("LEWS_TZ_IN_MEMORY", "0") == "1"  # faster lookups, ~60 MB more RAM
+TIMEZONE_CACHE_DECIMALS = 2  # ~1 km; timezone borders don't need more
+
+@st.cache_resource(show_spinner=False)
+def get_timezone_finder():
+    """Load TimezoneFinder's polygon data once per process"""
+    return TimezoneFinder(in_memory=TIMEZONE_FINDER_IN_MEMORY)
+
+@st.cache_resource(show_spinner=False)
+def get_timezone_memo():
+    """Process-wide {(rounded lat, rounded lon): tz name}"""
+    return {}
 
 def get_timezone(lat, lon):
-    tf = TimezoneFinder()
-    tz = tf.timezone_at(lat=lat, lng=lon)
-    return tz or "UTC"
+    key = (round(lat, TIMEZONE_CACHE_DECIMALS), round(lon, TIMEZONE_CACHE_DECIMALS))
+    memo = get_timezone_memo()
+    tz = memo.get(key)
+    if tz is None:
+        tz = get_timezone_finder().timezone_at(lat=lat, lng=lon) or "UTC"
+        memo[key] = tz
+    return tz
 
 def get_local_time(tz_name, time_format_24h=True):
     try:
@@ -231,9 +1293,15 @@ def get_link_preview(url):
     except Exception:
         return None
 
-@st.cache_data(ttl=600)
-def search_youtube_video(query):
-    """Search YouTube and return the first video URL or None."""
+YOUTUBE_HIT_TTL = 600                # seconds before a found preview is revalidated
+YOUTUBE_HIT_STALE_TTL = 7 * 24 * 3600
+YOUTUBE_MISS_TTL = 6 * 3600          # "no video for this title" is remembered separately
+YOUTUBE_FAILURE_TTL = 300            # failed lookups back off briefly instead of retrying every render
+YOUTUBE_PREVIEW_BUDGET = 2.0         # seconds a render waits for uncached lookups
+YOUTUBE_LOOKUP_WORKERS = 8
+
+def search_youtube_video_uncached(query):
+    """Embed URL of the first result, "" when YouTube has none, None when the lookup failed"""
     try:
         # Use YouTube search URL with urllib.parse.quote
         query_encoded = urllib.parse.quote(query)
@@ -245,7 +1313,7 @@ def search_youtube_video(query):
         # Parse video IDs from page HTML using regex
         video_ids = re.findall(r"watch\?v=(\S{11})", response.text)
         if not video_ids:
-            return None
+            return ""
         
         # Return embed url for first video
         first_video_id = video_ids[0]
@@ -254,37 +1322,499 @@ def search_youtube_video(query):
     except Exception:
         return None
 
-@st.cache_data(ttl=900, show_spinner=False)
-def fetch_feed(url):
+class YoutubePreviewResolver:
+    """Resolves YouTube previews for many titles at once, shared by every session.
+
+    Lookups run on a process-wide pool and are deduplicated across renders;
+    whatever misses the per-render budget keeps running and lands in the
+    disk cache for the next rerun.
+    """
+
+    def __init__(self, disk_cache, max_workers=YOUTUBE_LOOKUP_WORKERS):
+        self.disk_cache = disk_cache
+        self.lock = threading.Lock()
+        self.in_flight = {}  # title -> Future
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="lews-youtube"
+        )
+
+    def resolve(self, titles, budget=YOUTUBE_PREVIEW_BUDGET):
+        """{title: embed URL or None}; never waits longer than `budget` seconds"""
+        previews, pending = {}, {}
+        for title in dict.fromkeys(t for t in titles if t):
+            value, is_fresh = self.disk_cache.get(disk_cache_key("youtube", title))
+            if value is None:
+                future, started = self._submit(title)
+                if started:
+                    pending[title] = future
+                else:
+                    previews[title] = None  # already missed an earlier render's budget
+                continue
+            previews[title] = value or None  # "" is a remembered miss
+            if not is_fresh:
+                self._submit(title)  # stale hit: serve it, refresh behind the render
+
+        if pending:
+            done, _ = concurrent.futures.wait(pending.values(), timeout=budget)
+            for title, future in pending.items():
+                if future in done and future.result():
+                    previews[title] = future.result()
+                else:
+                    previews.setdefault(title, None)
+        return previews
+
+    def _submit(self, title):
+        """(future, started) - joins a lookup that is already running instead of starting another"""
+        with self.lock:
+            future = self.in_flight.get(title)
+            if future is not None:
+                return future, False
+            future = self.executor.submit(self._lookup, title)
+            self.in_flight[title] = future
+        future.add_done_callback(lambda f, title=title: self._forget(title))
+        return future, True
+
+    def _forget(self, title):
+        with self.lock:
+            self.in_flight.pop(title, None)
+
+    def _lookup(self, title):
+        value = search_youtube_video_uncached(title)
+        key = disk_cache_key("youtube", title)
+        if value:
+            self.disk_cache.set(key, value, YOUTUBE_HIT_TTL, YOUTUBE_HIT_STALE_TTL)
+        else:
+            self.disk_cache.set(key, "", YOUTUBE_MISS_TTL if value == "" else YOUTUBE_FAILURE_TTL)
+        return value or None
+
+@st.cache_resource(show_spinner=False)
+def get_youtube_previews():
+    """Process-wide preview resolver (bound to a module global for the worker threads)"""
+    return YoutubePreviewResolver(get_disk_cache())
+
+YOUTUBE_PREVIEWS = get_youtube_previews()
+
+@st.cache_resource
+def get_feed_validators():
+    """Process-wide {url: {"etag", "last_modified", "feed"}} that outlives fetch_feed cache entries"""
+    return {}
+
+def fetch_feed_conditional(url, validators):
+    """Fetch and parse a feed, revalidating with ETag / Last-Modified when we have them.
+
+    On 304 Not Modified the previously parsed feed stored in `validators` is reused.
+    """
     try:
-        response = smart_request(url, timeout=5)
-        if not response or response.status_code != 200:
+        cached = validators.get(url)
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        response = smart_request(url, timeout=5, headers=headers)
+        if not response:
+            return None
+        if response.status_code == 304 and cached:
+            return cached["feed"]
+        if response.status_code != 200:
             return None
         feed = feedparser.parse(response.text)
         feed_dict = {
-            "feed": dict(feed.feed) if feed.feed else {},
-            "entries": [dict(entry) for entry in feed.entries]
+            "feed": {"title": feed.feed.get("title", "")} if feed.feed else {},
+            "entries": normalize_entries(feed.entries)
         }
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            validators[url] = {"etag": etag, "last_modified": last_modified, "feed": feed_dict}
+        else:
+            validators.pop(url, None)
         return feed_dict
     except Exception:
         return None
 
-def filter_recent_entries(entries, minutes=30):
-    now = datetime.utcnow()
-    recent = []
+FEED_CACHE_TTL = 900
+FEED_CACHE_NAMESPACE = "feed-v3"  # bumped when the cached entry format changes
+FEED_CACHE_STALE_TTL = 24 * 3600
+
+# =============== Concurrent Feed Fetching ===============
+FEED_FETCH_MAX_WORKERS = 16
+FEED_FETCH_PER_HOST_LIMIT = 4
+FEED_FETCH_DEADLINE = 12  # seconds a render waits for feeds the poller has no data for yet
+
+def entry_timestamp(entry):
+    """UTC epoch seconds of an entry, or None.
+
+    Prefers feedparser's already-normalized published_parsed / updated_parsed
+    structs (UTC) and only falls back to dateutil for the raw strings.
+    """
+    for key in ("published_parsed", "updated_parsed"):
+        parsed = entry.get(key)
+        if parsed:
+            try:
+                return float(calendar.timegm(parsed))
+            except (TypeError, ValueError, OverflowError):
+                pass
+    published = entry.get("published") or entry.get("updated")
+    if not published:
+        return None
+    try:
+        published_dt = date_parser.parse(published)
+    except Exception:
+        return None
+    if not published_dt.tzinfo:
+        published_dt = pytz.UTC.localize(published_dt)
+    return published_dt.timestamp()
+
+ENTRY_SUMMARY_MAX_CHARS = 200
+
+# src attribute inside one <img ...> tag; skips quoted attribute values, accepts quoted or bare src.
+# Only ever matched between "<img" and the end of that tag (see tag_end), so unterminated tags
+# can't make it scan the rest of the document again for every "<img".
+IMG_SRC_RE = re.compile(
+    r"""<img\b(?:[^>"']|"[^"]*"|'[^']*')*?\ssrc\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
+TAG_DELIMITER_RE = re.compile(r"""[>"']""")
+
+def tag_end(markup, start):
+    """Index of the ">" closing the tag opened at `start`, skipping quoted values; -1 if unterminated"""
+    pos = start
+    while True:
+        match = TAG_DELIMITER_RE.search(markup, pos)
+        if match is None:
+            return -1
+        if match.group() == ">":
+            return match.start()
+        pos = markup.find(match.group(), match.end()) + 1  # jump past the closing quote
+        if pos == 0:
+            return -1
+
+def first_img_src(markup):
+    """src of the first <img> in an HTML fragment, without building a parse tree (linear time)"""
+    if not markup:
+        return None
+    lowered = markup.lower()
+    start = lowered.find("<img")
+    while start != -1:
+        end = tag_end(markup, start)
+        if end == -1:
+            return None  # unterminated tag, and no later tag can be closed either
+        match = IMG_SRC_RE.match(markup, start, end)
+        if match:
+            src = html.unescape(next(group for group in match.groups() if group is not None)).strip()
+            if src and not src.startswith("data:"):
+                return src
+        start = lowered.find("<img", end)
+    return None
+
+def extract_entry_image(entry):
+    """Thumbnail of a raw feedparser entry, resolved once at ingest.
+
+    Order: image media_content, media_thumbnail, image enclosures, then the
+    first <img> in the content and finally in the summary.
+    """
+    for media in entry.get("media_content") or []:
+        if media.get("type", "").startswith("image/") or media.get("medium") == "image":
+            if media.get("url"):
+                return media["url"]
+    for thumb in entry.get("media_thumbnail") or []:
+        if thumb.get("url"):
+            return thumb["url"]
+    for enc in entry.get("enclosures") or []:
+        if enc.get("type", "").startswith("image/") and enc.get("href"):
+            return enc["href"]
+    for content in entry.get("content") or []:
+        src = first_img_src(content.get("value", ""))
+        if src:
+            return src
+    return first_img_src(entry.get("summary") or entry.get("description") or "")
+
+ENTRY_COLUMNS = ("title", "link", "summary", "image")
+HTML_TAG_RE = re.compile(r"<[^<>]*>")  # stops at the next "<", so a run of unclosed "<" stays linear
+
+def strip_html(markup):
+    """Plain text of an HTML fragment (summaries are shown and spoken as text)"""
+    if "<" in markup:
+        markup = HTML_TAG_RE.sub(" ", markup)
+    return " ".join(html.unescape(markup).split())
+
+def normalize_entries(entries):
+    """Columnar form of raw feedparser entries: one list per UI field plus a float64 "published_ts" array.
+
+    Plain lists and one numpy array pickle far faster and smaller than
+    per-entry objects, and stay loadable across script reruns.
+    """
+    columns = {name: [] for name in ENTRY_COLUMNS}
+    stamps = []
     for entry in entries:
-        published = entry.get("published") or entry.get("updated")
-        if not published:
+        summary = strip_html(entry.get("summary") or entry.get("description") or "")
+        if len(summary) > ENTRY_SUMMARY_MAX_CHARS:
+            summary = summary[:ENTRY_SUMMARY_MAX_CHARS] + "..."
+        columns["title"].append(entry.get("title", "No title"))
+        columns["link"].append(entry.get("link", "#"))
+        columns["summary"].append(summary)
+        columns["image"].append(extract_entry_image(entry))
+        ts = entry_timestamp(entry)
+        stamps.append(np.nan if ts is None else ts)
+    columns["published_ts"] = np.array(stamps, dtype=np.float64)
+    return columns
+
+class FeedEntry:
+    """One article as the UI shows it; built per render from the cached columns"""
+    __slots__ = ("title", "link", "summary", "published_ts", "image", "feed_name")
+
+    def __init__(self, title, link, summary, published_ts, image=None, feed_name=None):
+        self.title = title
+        self.link = link
+        self.summary = summary
+        self.published_ts = published_ts
+        self.image = image
+        self.feed_name = feed_name
+
+    @classmethod
+    def from_columns(cls, columns, i, feed_name=None):
+        return cls(columns["title"][i], columns["link"][i], columns["summary"][i],
+                   float(columns["published_ts"][i]), columns["image"][i], feed_name)
+
+    def published_dt(self, tz=pytz.UTC):
+        return datetime.fromtimestamp(self.published_ts, tz)
+
+def aggregate_city_feeds(df_city, minutes=30, tz_name=None):
+    """Fetch and filter every feed of a city once per render.
+
+    Returns {"feeds": {url: [FeedEntry]}, "entries": [all entries, newest first],
+    "tz": tz}. Entries carry their feed name; show times with
+    entry.published_dt(city_news["tz"]) (`tz_name`, default UTC).
+    """
+    tz = pytz.UTC
+    if tz_name:
+        try:
+            tz = pytz.timezone(tz_name)
+        except pytz.UnknownTimeZoneError:
+            pass
+    city_news = {"feeds": {}, "entries": [], "tz": tz}
+    if df_city.empty:
+        return city_news
+
+    cutoff = time.time() - minutes * 60
+    urls = df_city["url"].tolist()
+
+    # Read what the background poller already has; feeds it has never polled are fetched
+    # through the poller too, so a cold render joins its polls instead of fetching twice.
+    # Feeds whose polls failed render empty until their next scheduled poll succeeds
+    poller = get_feed_poller()
+    poller.watch(urls)
+    feed_results = {url: poller.get(url) for url in urls}
+    missing = [url for url, feed_data in feed_results.items() if feed_data is None]
+    if missing:
+        feed_results.update(poller.fetch(missing))
+    sources, stamps = [], []
+    for url, feed_name in zip(df_city["url"], df_city["name"]):
+        if url in city_news["feeds"]:
             continue
+        city_news["feeds"][url] = []
+        feed_data = feed_results.get(url)
+        if feed_data and len(feed_data["entries"]["published_ts"]):
+            sources.append((url, feed_name, feed_data["entries"]))
+            stamps.append(feed_data["entries"]["published_ts"])
+    if not sources:
+        return city_news
+
+    # Filter and sort newest first over the timestamp array, not per entry
+    owners = np.repeat(np.arange(len(sources)), [len(part) for part in stamps])
+    offsets = np.cumsum([0] + [len(part) for part in stamps])
+    stamps = np.concatenate(stamps)
+    recent = np.flatnonzero(stamps >= cutoff)
+    recent = recent[np.argsort(-stamps[recent], kind="stable")]
+    for i in recent:
+        owner = owners[i]
+        url, feed_name, columns = sources[owner]
+        entry = FeedEntry.from_columns(columns, i - offsets[owner], feed_name)
+        city_news["feeds"][url].append(entry)
+        city_news["entries"].append(entry)
+    return city_news
+
+# =============== Background Feed Poller ===============
+FEEDS_CSV_PATH = "cleaned_news_feeds.csv"
+FEED_POLL_MIN_INTERVAL = 120    # seconds
+FEED_POLL_MAX_INTERVAL = 3600
+FEED_POLL_DEFAULT_INTERVAL = 900
+
+def estimate_poll_interval(feed_data, previous=None):
+    """Poll about twice per typical gap between a feed's articles; back off on failures"""
+    if not feed_data or not len(feed_data["entries"]["published_ts"]):
+        if previous is None:
+            return FEED_POLL_DEFAULT_INTERVAL
+        return min(previous * 2, FEED_POLL_MAX_INTERVAL)
+    stamps = feed_data["entries"]["published_ts"]
+    gaps = np.diff(np.sort(stamps[~np.isnan(stamps)]))
+    gaps = gaps[gaps > 0]
+    if not gaps.size:
+        return FEED_POLL_DEFAULT_INTERVAL
+    interval = float(np.median(gaps)) / 2
+    return min(max(interval, FEED_POLL_MIN_INTERVAL), FEED_POLL_MAX_INTERVAL)
+
+class FeedPoller:
+    """Process-wide thread that refreshes every known feed on its own schedule.
+
+    Results are published to an in-memory store that page renders read from,
+    so a rerun never has to wait on an upstream feed.
+    """
+
+    def __init__(self, csv_path=FEEDS_CSV_PATH, max_workers=FEED_FETCH_MAX_WORKERS,
+                 per_host_limit=FEED_FETCH_PER_HOST_LIMIT):
+        self.csv_path = csv_path
+        self.per_host_limit = per_host_limit
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.store = {}      # url -> feed_data
+        self.due = {}        # url -> next poll time
+        self.intervals = {}  # url -> current poll interval; set once a poll finished, failed or not
+        self.in_flight = {}  # url -> Future
+        self.host_slots = {}
+        self.catalog_signature = None
+        self.catalog_urls = set()
+        self.validators = get_feed_validators()
+        self.disk_cache = get_disk_cache()
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="lews-feed-fetch"
+        )
+        self.thread = threading.Thread(target=self._run, name="lews-feed-poller", daemon=True)
+        self.thread.start()
+
+    def get(self, url):
+        with self.lock:
+            feed_data = self.store.get(url)
+        if feed_data is None:
+            # Warm start: serve what the previous process left on disk until the next poll lands
+            feed_data, _ = self.disk_cache.get(disk_cache_key(FEED_CACHE_NAMESPACE, url))
+            if feed_data is not None:
+                with self.lock:
+                    self.store.setdefault(url, feed_data)
+        return feed_data
+
+    def watch(self, urls):
+        """Start polling feeds that are not scheduled yet"""
+        added = False
+        with self.lock:
+            for url in urls:
+                if url and url not in self.due:
+                    self.due[url] = 0
+                    added = True
+        if added:
+            self.wakeup.set()
+
+    def unwatch(self, urls):
+        """Stop polling feeds and drop what is stored for them"""
+        with self.lock:
+            for url in urls:
+                self.due.pop(url, None)
+                self.intervals.pop(url, None)
+                self.store.pop(url, None)
+
+    def fetch(self, urls, deadline=FEED_FETCH_DEADLINE):
+        """{url: feed_data} for feeds never polled yet, whatever lands within `deadline`.
+
+        Joins polls already in flight. Feeds that were polled and failed are
+        left to their backoff schedule instead of being refetched per render.
+        """
+        with self.lock:
+            urls = [url for url in dict.fromkeys(urls) if url and url not in self.intervals]
+        futures = {url: self._submit(url) for url in urls}
+        done, _ = concurrent.futures.wait(futures.values(), timeout=deadline)
+        results = {}
+        for url, future in futures.items():
+            if future in done:
+                try:
+                    results[url] = future.result()
+                except Exception:
+                    results[url] = None
+        return results  # stragglers still land in the store and the disk cache
+
+    def status(self):
+        with self.lock:
+            return {
+                "feeds": len(self.due),
+                "cached": len(self.store),
+                "failing": sum(1 for url in self.intervals if url not in self.store),
+                "in_flight": len(self.in_flight),
+            }
+
+    def _reload_catalog(self):
+        signature = catalog_signature(self.csv_path)
+        if signature == self.catalog_signature or signature[0] is None:
+            return
         try:
-            published_dt = date_parser.parse(published)
-            if published_dt.tzinfo:
-                published_dt = published_dt.astimezone(pytz.UTC).replace(tzinfo=None)
-            if now - published_dt <= timedelta(minutes=minutes):
-                recent.append(entry)
+            df = load_feeds_with_journal(self.csv_path)
         except Exception:
-            continue
-    return recent
+            return
+        self.catalog_signature = signature
+        urls = set(df["url"].dropna().tolist())
+        # Feeds removed from the catalog stop being polled; renders re-watch whatever they still show
+        self.unwatch(self.catalog_urls - urls)
+        self.catalog_urls = urls
+        self.watch(urls)
+
+    def _submit(self, url):
+        """Future of the poll for `url`, starting one unless it is already running"""
+        with self.lock:
+            future = self.in_flight.get(url)
+            if future is not None:
+                return future
+            future = self.executor.submit(self._fetch, url)
+            self.in_flight[url] = future
+            self.due.setdefault(url, 0)
+        future.add_done_callback(lambda f, url=url: self._done(url, f))
+        return future
+
+    def _fetch(self, url):
+        host = urllib.parse.urlparse(url).netloc
+        with self.lock:
+            slot = self.host_slots.setdefault(host, threading.BoundedSemaphore(self.per_host_limit))
+        with slot:
+            return fetch_feed_conditional(url, self.validators)
+
+    def _done(self, url, future):
+        try:
+            feed_data = future.result()
+        except Exception:
+            feed_data = None
+        with self.lock:
+            self.in_flight.pop(url, None)
+            if url not in self.due:
+                return  # unwatched while the poll was running
+            # Failures are recorded too: the backoff grows and renders stop fetching the feed inline
+            interval = estimate_poll_interval(feed_data, self.intervals.get(url))
+            self.intervals[url] = interval
+            self.due[url] = time.time() + interval
+            if feed_data is not None:
+                self.store[url] = feed_data
+        if feed_data is not None:
+            self.disk_cache.set(disk_cache_key(FEED_CACHE_NAMESPACE, url), feed_data,
+                                FEED_CACHE_TTL, FEED_CACHE_STALE_TTL)
+        self.wakeup.set()
+
+    def _run(self):
+        while True:
+            self.wakeup.clear()
+            self._reload_catalog()
+            now = time.time()
+            with self.lock:
+                ready = [url for url, due in self.due.items()
+                         if due <= now and url not in self.in_flight]
+            for url in ready:
+                self._submit(url)
+            with self.lock:
+                pending = [due for url, due in self.due.items() if url not in self.in_flight]
+            sleep_for = min(pending, default=now + 60) - time.time()
+            self.wakeup.wait(timeout=min(max(sleep_for, 1), 60))
+
+@st.cache_resource
+def get_feed_poller():
+    """Start the shared feed poller once per process"""
+    return FeedPoller()
 
 def speak(text, lang="de-DE"):
     safe_text = text.replace("\\", "\\\\").replace("`", "\\`").replace("\n", " ")
@@ -298,14 +1828,60 @@ def speak(text, lang="de-DE"):
     """
     components.html(js_code, height=0, width=0)
 
-@st.cache_data(ttl=1800)
-def fetch_14day_forecast(lat, lon):
-    url = (
-        f"https://api.open-meteo.com/v1/forecast?"
-        f"latitude={lat}&longitude={lon}"
+# =============== Weather Forecast ===============
+OPEN_METEO_FORECAST_URL = os.environ.get("LEWS_OPEN_METEO_URL", "https://api.open-meteo.com/v1/forecast")
+FORECAST_STALE_TTL = 6 * 3600
+FORECAST_FETCH_TIMEOUT = 12            # seconds a render waits for an uncached cell
+# Cells of 0.1 deg (~11 km) roughly match the resolution of Open-Meteo's global models
+FORECAST_GRID_RESOLUTION = float(os.environ.get("LEWS_FORECAST_GRID", 0.1))
+# Open-Meteo ingests new model runs about every 3 h and publishes them a little later
+FORECAST_MODEL_UPDATE_INTERVAL = 3 * 3600
+FORECAST_MODEL_UPDATE_DELAY = 45 * 60
+FORECAST_PREFETCH_INTERVAL = 60        # seconds between prefetch sweeps
+FORECAST_PREFETCH_LEAD = 120           # refresh watched cells this long before they expire
+FORECAST_BULK_BATCH = 50               # locations per multi-coordinate Open-Meteo request
+FORECAST_DAYS = 14
+DAYTIME_HOURS = (8, 20)  # inclusive, local time
+
+def forecast_url(lats, lons):
+    """Open-Meteo forecast URL for one or more locations (comma-separated coordinate lists)"""
+    return (
+        f"{OPEN_METEO_FORECAST_URL}?"
+        f"latitude={','.join(str(lat) for lat in lats)}&longitude={','.join(str(lon) for lon in lons)}"
         f"&daily=weathercode,temperature_2m_max,temperature_2m_min"
-        f"&timezone=auto&forecast_days=14"
+        f"&hourly=temperature_2m,weathercode"
+        f"&timezone=auto&forecast_days={FORECAST_DAYS}"
     )
+
+def fetch_forecasts_bulk(coords, batch_size=FORECAST_BULK_BATCH):
+    """Forecast JSON for many locations with a few multi-location requests.
+
+    Returns a list aligned with `coords`; entries are None where a batch failed.
+    """
+    coords = list(coords)
+    batches = [coords[i:i + batch_size] for i in range(0, len(coords), batch_size)]
+    urls = [forecast_url([lat for lat, _ in batch], [lon for _, lon in batch]) for batch in batches]
+    responses = smart_request_many(urls, max_retries=2, timeout=20)
+    results = []
+    for batch, url in zip(batches, urls):
+        data = None
+        response = responses.get(url)
+        if response is not None and response.status_code == 200:
+            try:
+                data = response.json()
+            except ValueError:
+                data = None
+        # A single location comes back as an object, several as a list in request order
+        if isinstance(data, dict):
+            data = [data]
+        if not isinstance(data, list) or len(data) != len(batch):
+            data = [None] * len(batch)
+        results.extend(data)
+    return results
+
+def fetch_forecast_uncached(lat, lon):
+    """Daily and hourly forecast in a single Open-Meteo request"""
+    url = forecast_url([lat], [lon])
     try:
         response = smart_request(url, timeout=10)
         if response and response.status_code == 200:
@@ -314,114 +1890,546 @@ def fetch_14day_forecast(lat, lon):
         return None
     return None
 
-@st.cache_data(ttl=1800)
-def fetch_hourly_forecast(lat, lon):
-    url = (
-        f"https://api.open-meteo.com/v1/forecast?"
-        f"latitude={lat}&longitude={lon}"
-        f"&hourly=temperature_2m,weathercode"
-        f"&timezone=auto"
+def convert_temperatures(celsius):
+    """{unit: rounded int array} for an array of Celsius values"""
+    return {
+        "Celsius": np.rint(celsius).astype(int),
+        "Fahrenheit": np.rint(celsius * 9 / 5 + 32).astype(int),
+    }
+
+def forecast_series(values, length):
+    """float64 array of an Open-Meteo series, exactly `length` long; nulls and gaps become NaN"""
+    series = np.full(length, np.nan)
+    values = np.array((values or [])[:length], dtype=np.float64)
+    series[:len(values)] = values
+    return series
+
+def weather_codes(values, length):
+    """int16 WMO codes; missing ones become -1, which WEATHER_MAP shows as unknown"""
+    return np.nan_to_num(forecast_series(values, length), nan=-1).astype(np.int16)
+
+class Forecast:
+    """Open-Meteo daily + hourly forecast parsed once into arrays.
+
+    Times are local to the location (timezone=auto). Temperatures are kept
+    in both units so display and speech only index into them.
+    """
+    __slots__ = (
+        "daily_labels", "daily_codes", "daily_max", "daily_min", "daily_idx",
+        "hourly_times", "hourly_codes", "hourly_temps", "daytime_idx", "hourly_labels",
     )
+
+    def __init__(self, data):
+        daily = data.get("daily") or {}
+        days = len(daily.get("time", []))
+        dates = np.array(daily.get("time", []), dtype="datetime64[D]")
+        self.daily_labels = [d.strftime("%a\n%b %d") for d in dates.astype(object)]
+        self.daily_codes = weather_codes(daily.get("weathercode"), days)
+        # Open-Meteo reports missing values as null; days without both extremes are left out,
+        # like hours without a temperature below (NaN must never reach the int conversion)
+        daily_max = forecast_series(daily.get("temperature_2m_max"), days)
+        daily_min = forecast_series(daily.get("temperature_2m_min"), days)
+        self.daily_max = convert_temperatures(np.nan_to_num(daily_max))
+        self.daily_min = convert_temperatures(np.nan_to_num(daily_min))
+        self.daily_idx = np.flatnonzero(~np.isnan(daily_max) & ~np.isnan(daily_min))
+
+        hourly = data.get("hourly") or {}
+        self.hourly_times = np.array(hourly.get("time", []), dtype="datetime64[m]")
+        hours = len(self.hourly_times)
+        self.hourly_codes = weather_codes(hourly.get("weathercode"), hours)
+        # Open-Meteo reports missing hours as null; NaN keeps the arrays numeric
+        temps = forecast_series(hourly.get("temperature_2m"), hours)
+        self.hourly_temps = convert_temperatures(np.nan_to_num(temps))
+        minute_of_day = (self.hourly_times - self.hourly_times.astype("datetime64[D]")).astype(int)
+        hour = minute_of_day // 60
+        self.daytime_idx = np.flatnonzero(
+            (hour >= DAYTIME_HOURS[0]) & (hour <= DAYTIME_HOURS[1]) & ~np.isnan(temps)
+        )
+        self.hourly_labels = {
+            int(i): f"{minute_of_day[i] // 60:02d}:{minute_of_day[i] % 60:02d}" for i in self.daytime_idx
+        }
+
+    @property
+    def has_daily(self):
+        return len(self.daily_idx) > 0
+
+    def days(self, unit="Celsius"):
+        """(label, code, max, min) per day that has both temperatures"""
+        idx = self.daily_idx
+        return list(zip((self.daily_labels[i] for i in idx.tolist()), self.daily_codes[idx].tolist(),
+                        self.daily_max[unit][idx].tolist(), self.daily_min[unit][idx].tolist()))
+
+    def daytime_hours(self, unit="Celsius", limit=12):
+        """(label, code, temp) for the first `limit` daytime hours"""
+        idx = self.daytime_idx[:limit]
+        return list(zip((self.hourly_labels[int(i)] for i in idx),
+                        self.hourly_codes[idx].tolist(), self.hourly_temps[unit][idx].tolist()))
+
+def parse_forecast(data):
+    if not data:
+        return None
     try:
-        response = smart_request(url, timeout=10)
-        if response and response.status_code == 200:
-            return response.json()
-    except Exception:
+        return Forecast(data)
+    except (TypeError, ValueError):
         return None
-    return None
+
+def forecast_cell(lat, lon, resolution=FORECAST_GRID_RESOLUTION):
+    """Grid cell (integer indices) a coordinate falls into"""
+    return round(float(lat) / resolution), round(float(lon) / resolution)
+
+def forecast_cell_center(cell, resolution=FORECAST_GRID_RESOLUTION):
+    """Coordinates requested for a cell, so every point inside it shares one forecast"""
+    return round(cell[0] * resolution, 4), round(cell[1] * resolution, 4)
+
+def next_model_update(now=None):
+    """Epoch time at which Open-Meteo should have published the next model run"""
+    now = time.time() if now is None else now
+    interval = FORECAST_MODEL_UPDATE_INTERVAL
+    last_run = (now - FORECAST_MODEL_UPDATE_DELAY) // interval * interval
+    return last_run + interval + FORECAST_MODEL_UPDATE_DELAY
+
+def forecast_ttl(now=None):
+    """Seconds until the next model update, so cached forecasts expire when new data appears"""
+    now = time.time() if now is None else now
+    return max(next_model_update(now) - now, 60)
+
+class ForecastStore:
+    """Process-wide forecasts keyed on a quantized grid cell instead of exact coordinates.
+
+    Entries expire at Open-Meteo's next model update and are served stale
+    (for up to FORECAST_STALE_TTL) while a background refresh runs. A
+    prefetch thread keeps every watched cell - the catalog cities - warm
+    with bulk multi-location requests, so switching cities never waits on
+    the network.
+    """
+
+    def __init__(self, disk_cache, resolution=FORECAST_GRID_RESOLUTION, start_prefetcher=True):
+        self.disk_cache = disk_cache
+        self.resolution = resolution
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.store = {}      # cell -> (Forecast, fresh_until)
+        self.in_flight = {}  # cell -> Future
+        self.watched = set()
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="lews-forecast"
+        )
+        if start_prefetcher:
+            self.thread = threading.Thread(target=self._run, name="lews-forecast-prefetch", daemon=True)
+            self.thread.start()
+
+    def get(self, lat, lon, timeout=FORECAST_FETCH_TIMEOUT):
+        """Forecast for the cell containing (lat, lon), or None"""
+        cell = forecast_cell(lat, lon, self.resolution)
+        now = time.time()
+        with self.lock:
+            forecast, fresh_until = self.store.get(cell, (None, 0))
+        if forecast is not None:
+            if now > fresh_until:
+                self._submit(cell)  # serve stale, refresh in the background
+            return forecast
+        forecast = self._from_disk(cell)
+        if forecast is not None:
+            return forecast
+        try:
+            return self._submit(cell).result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            return None
+
+    def watch(self, coords):
+        """Keep these locations' cells warm from now on"""
+        cells = {forecast_cell(lat, lon, self.resolution) for lat, lon in coords}
+        with self.lock:
+            added = cells - self.watched
+            self.watched |= added
+        if added:
+            self.wakeup.set()
+
+    def put(self, cell, data, ttl=None):
+        """Store a fetched forecast JSON for a cell (also used by bulk refreshers)"""
+        forecast = parse_forecast(data)
+        if forecast is None:
+            return None
+        ttl = forecast_ttl() if ttl is None else ttl
+        with self.lock:
+            self.store[cell] = (forecast, time.time() + ttl)
+        self.disk_cache.set(self._key(cell), data, ttl, FORECAST_STALE_TTL)
+        return forecast
+
+    def refresh_bulk(self, cells):
+        """Refresh many cells with a few multi-location requests; returns how many were updated"""
+        with self.lock:
+            cells = [cell for cell in dict.fromkeys(cells) if cell not in self.in_flight]
+            # Renders asking for these cells meanwhile wait on the bulk result instead of refetching
+            futures = {cell: concurrent.futures.Future() for cell in cells}
+            self.in_flight.update(futures)
+        updated = 0
+        try:
+            datas = fetch_forecasts_bulk(forecast_cell_center(cell, self.resolution) for cell in cells)
+            for cell, data in zip(cells, datas):
+                forecast = self.put(cell, data)
+                if forecast is not None:
+                    updated += 1
+                else:
+                    with self.lock:
+                        forecast = self.store.get(cell, (None, 0))[0]
+                futures[cell].set_result(forecast)
+        finally:
+            with self.lock:
+                for cell, future in futures.items():
+                    if self.in_flight.get(cell) is future:
+                        del self.in_flight[cell]
+            for future in futures.values():
+                if not future.done():
+                    future.set_result(None)
+        return updated
+
+    def status(self):
+        now = time.time()
+        with self.lock:
+            return {
+                "cells": len(self.store),
+                "fresh": sum(1 for _, fresh_until in self.store.values() if fresh_until >= now),
+                "watched": len(self.watched),
+                "in_flight": len(self.in_flight),
+            }
+
+    def _key(self, cell):
+        return disk_cache_key("forecast-cell", self.resolution, *cell)
+
+    def _submit(self, cell):
+        """Fetch a cell on the pool, joining a fetch that is already running"""
+        with self.lock:
+            future = self.in_flight.get(cell)
+            if future is not None:
+                return future
+            future = self.executor.submit(self._load, cell)
+            self.in_flight[cell] = future
+        future.add_done_callback(lambda f, cell=cell: self._forget(cell))
+        return future
+
+    def _forget(self, cell):
+        with self.lock:
+            self.in_flight.pop(cell, None)
+
+    def _from_disk(self, cell, refresh=True):
+        """Promote a forecast another process (or an earlier run) left on disk"""
+        data, is_fresh = self.disk_cache.get(self._key(cell))
+        forecast = parse_forecast(data)
+        if forecast is not None:
+            fresh_until = time.time() + forecast_ttl() if is_fresh else 0
+            with self.lock:
+                self.store.setdefault(cell, (forecast, fresh_until))
+            if not is_fresh and refresh:
+                self._submit(cell)
+        return forecast
+
+    def _load(self, cell):
+        data = fetch_forecast_uncached(*forecast_cell_center(cell, self.resolution))
+        forecast = self.put(cell, data)
+        if forecast is None:
+            with self.lock:
+                forecast = self.store.get(cell, (None, 0))[0]  # keep serving the stale copy
+        return forecast
+
+    def _run(self):
+        while True:
+            self.wakeup.clear()
+            now = time.time()
+            with self.lock:
+                due = [cell for cell in self.watched
+                       if self.store.get(cell, (None, 0))[1] < now + FORECAST_PREFETCH_LEAD
+                       and cell not in self.in_flight]
+            for cell in due:
+                if cell not in self.store:
+                    self._from_disk(cell, refresh=False)
+            due = [cell for cell in due
+                   if self.store.get(cell, (None, 0))[1] < now + FORECAST_PREFETCH_LEAD]
+            if due:
+                try:
+                    self.refresh_bulk(due)
+                except Exception:
+                    pass  # Cells stay due; the next sweep (or a render) retries them
+            self.wakeup.wait(timeout=FORECAST_PREFETCH_INTERVAL)
+
+@st.cache_resource(show_spinner=False)
+def get_forecast_store():
+    """Process-wide forecast store (bound to a module global for the worker threads)"""
+    return ForecastStore(get_disk_cache())
+
+FORECASTS = get_forecast_store()
+
+def get_forecast(lat, lon):
+    """Parsed Forecast for a location, or None; shared read-only across sessions"""
+    return FORECASTS.get(lat, lon)
+
+# =============== HTML Templates ===============
+# Each carousel / grid is rendered as ONE markdown element built from these
+# templates instead of one element per card. Fields use string.Template syntax.
+HTML_TEMPLATES = {
+    "daily_carousel": """
+        <div style="display: grid; grid-template-columns: repeat(7, minmax(0, 1fr));">$cards</div>
+    """,
+    "daily_card": """
+        <div class="glass-panel" style="text-align: center; padding: 10px; margin: 5px; border-radius: 16px;">
+            <div style="font-weight: 600; font-size: 16px; margin-bottom: 8px; white-space: pre-line;">$label</div>
+            <div style="font-size: 32px; margin-bottom: 8px;">$icon</div>
+            <div style="color: #00ff9d; margin-bottom: 4px; font-size: 12px;">$desc</div>
+            <div style="display: flex; justify-content: center; gap: 10px; font-size: 14px;">
+                <div>↑ <b>$max_temp$unit_symbol</b></div>
+                <div>↓ <b>$min_temp$unit_symbol</b></div>
+            </div>
+        </div>
+    """,
+    "hourly_carousel": """
+        <div style="display: grid; grid-template-columns: repeat($count, minmax(100px, 1fr)); overflow-x: auto;">$cards</div>
+    """,
+    "hourly_card": """
+        <div class="glass-panel" style="text-align: center; padding: 10px; margin: 5px; border-radius: 16px; min-width: 100px;">
+            <div style="font-weight: 600; margin-bottom: 8px; font-size: 14px;">$label</div>
+            <div style="font-size: 24px; margin-bottom: 8px;">$icon</div>
+            <div style="color: #00ff9d; margin-bottom: 4px; font-size: 12px;">$desc</div>
+            <div style="font-size: 16px; font-weight: 600;">$temp$unit_symbol</div>
+        </div>
+    """,
+    "news_grid": """
+        <div style="display: grid; grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 1rem;">$cards</div>
+    """,
+    "news_scroller": """
+        <div class="news-scroller">$cards</div>
+    """,
+    "news_scroller_item": """
+        <div class="news-item">$card</div>
+    """,
+    "news_card": """
+        <div class="news-card glass-panel" style="margin-bottom: 25px;">
+            $media
+            <h4 style="margin-top: 0; margin-bottom: 10px; font-size: 18px;">$title</h4>
+            <small style="display: block; margin-bottom: 10px; color: #aaaaaa;">$feed_name • $published</small>
+            <p style="font-size: 14px; margin-bottom: 15px; color: #e0e0e0;">$summary</p>
+            <a href="$link" target="_blank" style="display: inline-block; padding: 8px 15px; background: rgba(0, 255, 157, 0.1); border-radius: 8px; color: #00ff9d !important; text-decoration: none; font-weight: 600; transition: all 0.3s;">Read Full Article</a>
+        </div>
+    """,
+    "news_video": """
+        <div style="border-radius: 10px; overflow: hidden; margin-bottom: 15px;">
+            <iframe width="100%" height="$height"
+                    src="$video_url?autoplay=1&mute=1"
+                    frameborder="0"
+                    allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; presentation"
+                    allowfullscreen
+                    sandbox="allow-scripts allow-same-origin allow-presentation">
+            </iframe>
+        </div>
+    """,
+    "news_image": """
+        <img src="$image_url" alt="$title_attr" style="width: 100%; height: 180px; object-fit: cover; border-radius: 12px; margin-bottom: 15px;">
+    """,
+    "tab_entry": """
+        <h3><a href="$link" target="_blank">$title</a></h3>
+        <span style="color:#aaaaaa">$published</span>
+        <div style="color:#cccccc">$summary</div>
+    """,
+    "tab_video": """
+        <div style="border-radius: 10px; overflow: hidden; margin-bottom: 15px;">
+            <iframe width="100%" height="200"
+                    src="$video_url"
+                    frameborder="0"
+                    allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; presentation"
+                    allowfullscreen
+                    sandbox="allow-scripts allow-same-origin allow-presentation">
+            </iframe>
+        </div>
+    """,
+}
+
+def compile_html_template(source):
+    """Split a template into (literals, fields) once; rendering is then a single join.
+
+    Lines are stripped and joined so a section never contains blank or
+    indented lines that Markdown would turn into paragraphs / code blocks.
+    """
+    source = " ".join(line.strip() for line in source.strip().splitlines() if line.strip())
+    literals, fields, pos = [], [], 0
+    pending = ""
+    for match in string.Template.pattern.finditer(source):
+        pending += source[pos:match.start()]
+        pos = match.end()
+        if match.group("escaped") is not None:
+            pending += "$"
+            continue
+        name = match.group("named") or match.group("braced")
+        if name is None:
+            raise ValueError(f"Invalid placeholder in HTML template at offset {match.start()}")
+        literals.append(pending)
+        fields.append(name)
+        pending = ""
+    literals.append(pending + source[pos:])
+    return tuple(literals), tuple(fields)
+
+@st.cache_resource(show_spinner=False)
+def compile_html_templates(templates):
+    """Compiled form of every template; keyed on the sources so edits recompile"""
+    return {name: compile_html_template(source) for name, source in templates}
+
+COMPILED_HTML_TEMPLATES = compile_html_templates(tuple(HTML_TEMPLATES.items()))
+
+def render_html(name, **values):
+    literals, fields = COMPILED_HTML_TEMPLATES[name]
+    parts = [literals[0]]
+    for field, literal in zip(fields, literals[1:]):
+        parts.append(str(values[field]))
+        parts.append(literal)
+    return "".join(parts)
+
+# =============== Rendered Fragment Cache ===============
+FRAGMENT_CACHE_MAX_ENTRIES = 4096
+
+class FragmentCache:
+    """Process-wide LRU of rendered HTML fragments, keyed on a hash of their inputs.
+
+    Keys cover the data a fragment shows plus the display settings it
+    depends on, so a rerun that changes neither reuses the HTML as-is.
+    """
+
+    def __init__(self, max_entries=FRAGMENT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.fragments = OrderedDict()  # key -> HTML, least recently used first
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, key, render, *args, **kwargs):
+        """Cached HTML for `key`, calling render(*args, **kwargs) on a miss"""
+        with self.lock:
+            fragment = self.fragments.get(key)
+            if fragment is not None:
+                self.fragments.move_to_end(key)
+                self.hits += 1
+                return fragment
+            self.misses += 1
+        fragment = render(*args, **kwargs)
+        with self.lock:
+            self.fragments[key] = fragment
+            self.fragments.move_to_end(key)
+            while len(self.fragments) > self.max_entries:
+                self.fragments.popitem(last=False)
+        return fragment
+
+    def status(self):
+        with self.lock:
+            return {
+                "entries": len(self.fragments),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+@st.cache_resource(show_spinner=False)
+def get_fragment_cache(templates):
+    """Process-wide fragment cache; keyed on the template sources so edits start a fresh one"""
+    return FragmentCache()
+
+FRAGMENTS = get_fragment_cache(tuple(HTML_TEMPLATES.items()))
+
+def fragment_key(kind, *parts):
+    """Everything a fragment is rendered from; the dict hashes it and compares on collision"""
+    return (kind,) + parts
+
+def entry_time_format(time_format_24h=True):
+    return "%b %d, %H:%M" if time_format_24h else "%b %d, %I:%M %p"
+
+def hour_label(label, time_format_24h=True):
+    """Hourly card label ("HH:MM") in the chosen clock format"""
+    if time_format_24h:
+        return label
+    hour, minute = label.split(":")
+    hour = int(hour)
+    return f"{hour % 12 or 12}:{minute} {'AM' if hour < 12 else 'PM'}"
+
+def entry_fragment_key(kind, entry, tz, *settings):
+    return fragment_key(kind, entry.title, entry.link, entry.summary, entry.published_ts,
+                        entry.image, entry.feed_name, str(tz), *settings)
+
+def build_news_card(entry, tz, video_url=None, video_height=200, time_format_24h=True):
+    """One news card's HTML; plain-text title/summary are escaped here"""
+    title = html.escape(entry.title)
+    if video_url:
+        media = render_html("news_video", height=video_height, video_url=html.escape(video_url, quote=True))
+    else:
+        image_url = entry.image or "https://via.placeholder.com/600x300.png?text=No+Preview"
+        media = render_html("news_image", image_url=html.escape(image_url, quote=True), title_attr=title)
+    return render_html(
+        "news_card",
+        media=media,
+        title=title,
+        feed_name=html.escape(entry.feed_name or "Unknown"),
+        published=entry.published_dt(tz).strftime(entry_time_format(time_format_24h)),
+        summary=html.escape(entry.summary),
+        link=html.escape(entry.link, quote=True),
+    )
+
+def render_news_card(entry, tz, video_url=None, video_height=200, time_format_24h=True):
+    """One news card's HTML, reused from FRAGMENTS while the article and settings are unchanged"""
+    key = entry_fragment_key("news_card", entry, tz, video_url, video_height, time_format_24h)
+    return FRAGMENTS.render(key, build_news_card, entry, tz, video_url, video_height, time_format_24h)
+
+def build_tab_entry(entry, tz, time_format_24h=True):
+    return render_html(
+        "tab_entry",
+        title=html.escape(entry.title),
+        link=html.escape(entry.link, quote=True),
+        published=entry.published_dt(tz).strftime(entry_time_format(time_format_24h)),
+        summary=html.escape(entry.summary),
+    )
+
+def render_tab_entry(entry, tz, time_format_24h=True):
+    """Title / time / summary block of a category tab entry, cached like the news cards"""
+    key = entry_fragment_key("tab_entry", entry, tz, time_format_24h)
+    return FRAGMENTS.render(key, build_tab_entry, entry, tz, time_format_24h)
+
+def render_tab_video(video_url):
+    return FRAGMENTS.render(fragment_key("tab_video", video_url), render_html,
+                            "tab_video", video_url=html.escape(video_url, quote=True))
 
 # =============== Updated Weather Display Functions ===============
-def display_weather_forecast(forecast_json, unit="Celsius"):
-    if forecast_json and "daily" in forecast_json:
-        daily = forecast_json["daily"]
-        dates = daily.get("time", [])
-        tmax = daily.get("temperature_2m_max", [])
-        tmin = daily.get("temperature_2m_min", [])
-        weather_codes = daily.get("weathercode", [])
-        
-        # Create columns for the carousel
-        cols = st.columns(7)  # 7 days per row
-        for i in range(len(dates)):
-            date = dates[i]
-            max_temp = tmax[i]
-            min_temp = tmin[i]
-            code = weather_codes[i]
-            icon, desc = WEATHER_MAP.get(code, ("🌈", "Unknown weather"))
-            date_fmt = datetime.strptime(date, "%Y-%m-%d").strftime("%a\n%b %d")
-            
-            # Convert to Fahrenheit if needed
-            if unit == "Fahrenheit":
-                max_temp = round((max_temp * 9/5) + 32)
-                min_temp = round((min_temp * 9/5) + 32)
-            else:
-                max_temp = round(max_temp)
-                min_temp = round(min_temp)
-                
-            unit_symbol = "°F" if unit == "Fahrenheit" else "°C"
-            
-            with cols[i % 7]:
-                with st.container():
-                    st.markdown(f"""
-                    <div class="glass-panel" style="text-align: center; padding: 10px; margin: 5px; border-radius: 16px;">
-                        <div style="font-weight: 600; font-size: 16px; margin-bottom: 8px;">{date_fmt}</div>
-                        <div style="font-size: 32px; margin-bottom: 8px;">{icon}</div>
-                        <div style="color: #00ff9d; margin-bottom: 4px; font-size: 12px;">{desc}</div>
-                        <div style="display: flex; justify-content: center; gap: 10px; font-size: 14px;">
-                            <div>↑ <b>{max_temp}{unit_symbol}</b></div>
-                            <div>↓ <b>{min_temp}{unit_symbol}</b></div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-def display_hourly_forecast(hourly_json, unit="Celsius"):
-    if hourly_json and "hourly" in hourly_json:
-        hourly = hourly_json["hourly"]
-        times = hourly.get("time", [])
-        temps = hourly.get("temperature_2m", [])
-        codes = hourly.get("weathercode", [])
-        
-        # Filter daytime hours
-        filtered_data = []
-        for i, time_str in enumerate(times):
-            try:
-                time_fmt = datetime.strptime(time_str, "%Y-%m-%dT%H:%M")
-                hour = time_fmt.hour
-                if 8 <= hour <= 20:
-                    temp = temps[i]
-                    # Convert to Fahrenheit if needed
-                    if unit == "Fahrenheit":
-                        temp = round((temp * 9/5) + 32)
-                    else:
-                        temp = round(temp)
-                    filtered_data.append({
-                        "time_str": time_str,
-                        "temp": temp,
-                        "code": codes[i],
-                        "hour": hour
-                    })
-            except Exception:
-                continue
-        filtered_data = filtered_data[:12]
-        
-        unit_symbol = "°F" if unit == "Fahrenheit" else "°C"
-        
-        # Create columns for the carousel
-        cols = st.columns(len(filtered_data))
-        for i, data in enumerate(filtered_data):
-            time_fmt = datetime.strptime(data["time_str"], "%Y-%m-%dT%H:%M")
-            label = time_fmt.strftime("%H:%M")
-            icon, desc = WEATHER_MAP.get(data["code"], ("🌈", "Unknown"))
-            
-            with cols[i]:
-                with st.container():
-                    st.markdown(f"""
-                    <div class="glass-panel" style="text-align: center; padding: 10px; margin: 5px; border-radius: 16px; min-width: 100px;">
-                        <div style="font-weight: 600; margin-bottom: 8px; font-size: 14px;">{label}</div>
-                        <div style="font-size: 24px; margin-bottom: 8px;">{icon}</div>
-                        <div style="color: #00ff9d; margin-bottom: 4px; font-size: 12px;">{desc}</div>
-                        <div style="font-size: 16px; font-weight: 600;">{data['temp']}{unit_symbol}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
+def build_daily_card(label, code, max_temp, min_temp, unit):
+    icon, desc = WEATHER_MAP.get(code, ("🌈", "Unknown weather"))
+    return render_html(
+        "daily_card", label=label, icon=icon, desc=desc, max_temp=max_temp, min_temp=min_temp,
+        unit_symbol="°F" if unit == "Fahrenheit" else "°C",
+    )
+
+def build_hourly_card(label, code, temp, unit, time_format_24h=True):
+    icon, desc = WEATHER_MAP.get(code, ("🌈", "Unknown"))
+    return render_html(
+        "hourly_card", label=hour_label(label, time_format_24h), icon=icon, desc=desc, temp=temp,
+        unit_symbol="°F" if unit == "Fahrenheit" else "°C",
+    )
+
+def render_daily_cards(forecast, unit="Celsius"):
+    """Daily carousel HTML; each day's card comes from FRAGMENTS while its values are unchanged"""
+    cards = [
+        FRAGMENTS.render(fragment_key("daily_card", *day, unit), build_daily_card, *day, unit)
+        for day in forecast.days(unit)
+    ]
+    # 7 days per row, the whole carousel in one element
+    return render_html("daily_carousel", cards="".join(cards))
+
+def render_hourly_cards(forecast, unit="Celsius", time_format_24h=True):
+    cards = [
+        FRAGMENTS.render(fragment_key("hourly_card", *hour, unit, time_format_24h),
+                         build_hourly_card, *hour, unit, time_format_24h)
+        for hour in forecast.daytime_hours(unit)
+    ]
+    return render_html("hourly_carousel", count=len(cards), cards="".join(cards))
+
+def display_weather_forecast(forecast, unit="Celsius"):
+    if forecast and forecast.has_daily:
+        st.markdown(render_daily_cards(forecast, unit), unsafe_allow_html=True)
+
+def display_hourly_forecast(forecast, unit="Celsius", time_format_24h=True):
+    if forecast and forecast.daytime_hours(unit, limit=1):
+        st.markdown(render_hourly_cards(forecast, unit, time_format_24h), unsafe_allow_html=True)
 
 # =============== Multi-Grid Viewer Functions ===============
 def convert_to_embed_url(url):
@@ -1098,12 +3106,16 @@ st.markdown("""
 # Initialize session state
 init_grids()
 
+# Every render gets a fresh retry budget shared by all of its requests
+st.session_state.retry_budget = RetryBudget(RETRY_BUDGET_PER_RENDER)
+
 # Create tabs
 tab1, tab2 = st.tabs(["Home: Weather & News", "MyVü Multi-Stream"])
 
 # Proxy status indicator
-if 'proxy_cache' in st.session_state and st.session_state.proxy_cache.get('working_proxies'):
-    proxy_count = len(st.session_state.proxy_cache['working_proxies'])
+proxy_status = PROXY_POOL.status()
+if proxy_status["working_proxies"]:
+    proxy_count = proxy_status["working_proxies"]
     st.sidebar.markdown(f"""
         <div class="proxy-status">
             🌐 Using Proxy: {proxy_count} active proxies
@@ -1119,20 +3131,30 @@ else:
 # Proxy management in sidebar
 st.sidebar.title("🌐 Smart Proxy Settings")
 if st.sidebar.button("🔄 Refresh Proxy Pool", use_container_width=True, key="refresh_proxy_btn"):
-    if "proxy_cache" in st.session_state:
-        st.session_state.proxy_cache["last_refresh"] = 0
+    PROXY_POOL.force_refresh()
     st.rerun()
 
 proxy_debug = st.sidebar.checkbox("Show proxy debug info", key="proxy_debug")
-if proxy_debug and "proxy_cache" in st.session_state:
+if proxy_debug:
     st.sidebar.write("**Proxy Cache Status:**")
     st.sidebar.json({
-        "total_proxies": len(st.session_state.proxy_cache["proxies"]),
-        "working_proxies": len(st.session_state.proxy_cache["working_proxies"]),
+        **proxy_status,
         "last_refresh": datetime.fromtimestamp(
-            st.session_state.proxy_cache["last_refresh"]
+            proxy_status["last_refresh"]
         ).strftime("%Y-%m-%d %H:%M:%S")
     })
+    st.sidebar.write("**HTTP Connection Pool:**")
+    st.sidebar.json(HTTP_SESSIONS.stats.snapshot())
+    st.sidebar.write("**Host Circuit Breakers:**")
+    breakers = HOST_BREAKERS.snapshot()
+    if breakers:
+        st.sidebar.json(breakers)
+    else:
+        st.sidebar.caption("All hosts healthy")
+    st.sidebar.write("**Forecast Cache:**")
+    st.sidebar.json(FORECASTS.status())
+    st.sidebar.write("**Fragment Cache:**")
+    st.sidebar.json(FRAGMENTS.status())
 
 with tab1:
     st.title("LEWS Beta.1.0 Local 🌦️ Weather & 📰 News")
@@ -1151,7 +3173,7 @@ with tab1:
     # Add temperature unit selector
     temp_unit = st.sidebar.radio("Temperature Unit", ["Celsius", "Fahrenheit"], index=0, key="temp_unit")
 
-    csv_path = st.sidebar.text_input("Path to feeds CSV file:", value="cleaned_news_feeds.csv", key="csv_path")
+    csv_path = st.sidebar.text_input("Path to feeds CSV file:", value=FEEDS_CSV_PATH, key="csv_path")
     feed_interval_minutes = st.sidebar.slider(
         "Feed refresh interval (minutes) for new articles",
         min_value=5,
@@ -1162,53 +3184,41 @@ with tab1:
     )
 
     # Load feeds CSV
-    if os.path.exists(csv_path):
+    if os.path.exists(csv_path) or os.path.exists(csv_path + CATALOG_JOURNAL_SUFFIX):
         try:
-            encoding = detect_encoding(csv_path)
-            df = pd.read_csv(csv_path, encoding=encoding, sep='\t')
-            required_cols = ["city", "country", "category", "name", "url"]
-            for col in required_cols:
-                if col not in df.columns:
-                    st.error(f"CSV must include column: {col}")
-                    st.stop()
-            if "lat" not in df.columns:
-                df["lat"] = None
-            if "lon" not in df.columns:
-                df["lon"] = None
+            catalog = load_feeds_catalog(csv_path)
         except Exception as e:
             st.error(f"Failed to load CSV: {e}")
             st.stop()
     else:
-        df = pd.DataFrame(columns=["city", "country", "category", "name", "url", "lat", "lon"])
+        catalog = build_feeds_catalog(
+            pd.DataFrame(columns=["city", "country", "category", "name", "url", "lat", "lon"])
+        )
+    df = catalog["df"]
+
+    # Keep every catalog city's forecast warm so switching cities never waits on Open-Meteo;
+    # the coordinates were validated once when the catalog was built
+    FORECASTS.watch((lat, lon) for lat, lon, _ in catalog["locations"].values())
 
     # City Selection
-    cities = sorted(df["city"].dropna().unique().tolist())
+    cities = catalog["cities"]
     if not cities:
         city_ip, region, country, lat, lon = get_ip_location()
         cities = [city_ip]
     
     selected_city = st.sidebar.selectbox("Select city", options=cities, index=0, key="city_selector")
     
-    # Filter dataframe by selected city
-    df_city = df[df["city"] == selected_city]
+    # Feeds of the selected city, straight from the prebuilt index
+    df_city = catalog["by_city"].get(selected_city, df.iloc[0:0])
     
-    # Get coordinates - always fall back to Hamburg if needed
-    valid_coords = False
-    if not df_city.empty:
-        try:
-            lat = float(df_city.iloc[0]["lat"])
-            lon = float(df_city.iloc[0]["lon"])
-            if -90 <= lat <= 90 and -180 <= lon <= 180:
-                valid_coords = True
-            else:
-                # Coordinates are out of range
-                city_ip, region, country, lat, lon = get_ip_location()
-        except (TypeError, ValueError):
-            # Parsing failed
-            city_ip, region, country, lat, lon = get_ip_location()
-
-    if not valid_coords:
+    # Coordinates and timezone were resolved once when the catalog was built.
+    # Out-of-range, unparsable or missing coordinates all fall back to IP geolocation
+    location = catalog["locations"].get(selected_city)
+    if location:
+        lat, lon, tz_name = location
+    else:
         city_ip, region, country, lat, lon = get_ip_location()
+        tz_name = get_timezone(lat, lon)
 
     # Add New Feed
     with st.sidebar.expander("➕ Add a New Feed"):
@@ -1230,7 +3240,7 @@ with tab1:
                 new_lon_f = None
 
             if all([new_city.strip(), new_country.strip(), new_category.strip(), new_name.strip(), new_url.strip()]) and new_lat_f is not None and new_lon_f is not None:
-                new_row = pd.DataFrame([{
+                new_row = {
                     "city": new_city.strip(),
                     "country": new_country.strip(),
                     "category": new_category.strip(),
@@ -1238,118 +3248,42 @@ with tab1:
                     "url": new_url.strip(),
                     "lat": new_lat_f,
                     "lon": new_lon_f,
-                }])
-                df = pd.concat([df, new_row], ignore_index=True)
+                }
                 try:
-                    df.to_csv(csv_path, sep='\t', index=False, encoding="utf-8")
-                    st.success(f"Feed added for {new_city}. Please refresh to see it in the list.")
+                    append_feed(csv_path, new_row)
                 except Exception as e:
                     st.error(f"Failed to save feed: {e}")
+                else:
+                    # The catalog signature changed, so the rerun rebuilds the index with the new feed
+                    get_feed_poller().watch([new_row["url"]])
+                    st.session_state.feed_added_msg = f"Feed added for {new_row['city']}."
+                    st.rerun()
             else:
                 st.warning("Please fill in all fields with valid data.")
 
+        if "feed_added_msg" in st.session_state:
+            st.success(st.session_state.pop("feed_added_msg"))
+
     # Display current local time
-    tz_name = get_timezone(lat, lon)
     local_time_str = get_local_time(tz_name, time_format_24h)
     st.markdown(f"### Current local time in **{selected_city}** ({tz_name}): <span style='color:#00ff9d'>{local_time_str}</span>", unsafe_allow_html=True)
     
     # ========== BREAKING NEWS GRID ==========
     st.markdown("### 📰 Breaking News Feed")
 
-    # Get news entries
-    all_entries = []
-    if not df_city.empty:
-        for _, feed_row in df_city.iterrows():
-            url = feed_row["url"]
-            feed_data = fetch_feed(url)
-            if feed_data and "entries" in feed_data:
-                entries = filter_recent_entries(feed_data["entries"], minutes=feed_interval_minutes)
-                for entry in entries:
-                    entry["feed_name"] = feed_row["name"]
-                    all_entries.append(entry)
+    # Get news entries (shared by the grid, the category tabs and the city-wide summary)
+    city_news = aggregate_city_feeds(df_city, minutes=feed_interval_minutes, tz_name=tz_name)
+    all_entries = city_news["entries"]
+
+    # One batched lookup for every card on the page (grid, scroller and category tabs)
+    video_previews = YOUTUBE_PREVIEWS.resolve([entry.title for entry in all_entries])
 
     if all_entries:
-        all_entries.sort(key=lambda x: date_parser.parse(x.get("published") or datetime.min), reverse=True)
-        
-        # Show only 3 articles (one row)
-        news_items = all_entries[:3]
-        
-        # Create grid layout with 3 columns
-        cols = st.columns(3)
-        for idx, entry in enumerate(news_items):
-            title = entry.get("title", "No title")
-            summary = entry.get("summary") or entry.get("description") or ""
-            link = entry.get("link", "#")
-            published = entry.get("published") or entry.get("updated") or ""
-            feed_name = entry.get("feed_name", "Unknown")
-        
-            # Get video preview
-            video_url = search_youtube_video(title)
-            
-            # Format published date
-            try:
-                published_dt = date_parser.parse(published)
-                published_str = published_dt.strftime("%b %d, %H:%M")
-            except:
-                published_str = published
-            
-            # Truncate summary
-            if len(summary) > 200:
-                summary = summary[:200] + "..."
-            
-            # Create card in grid
-            with cols[idx]:
-                # Display video preview if available
-                if video_url:
-                    st.markdown(f"""
-                        <div class="news-card glass-panel" style="margin-bottom: 25px;">
-                            <div style="border-radius: 10px; overflow: hidden; margin-bottom: 15px;">
-                                <iframe width="100%" height="200" 
-                                        src="{video_url}?autoplay=1&mute=1" 
-                                        frameborder="0" 
-                                        allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; presentation" 
-                                        allowfullscreen
-                                        sandbox="allow-scripts allow-same-origin allow-presentation">
-                                </iframe>
-                            </div>
-                            <h4 style="margin-top: 0; margin-bottom: 10px; font-size: 18px;">{title}</h4>
-                            <small style="display: block; margin-bottom: 10px; color: #aaaaaa;">{feed_name} • {published_str}</small>
-                            <p style="font-size: 14px; margin-bottom: 15px; color: #e0e0e0;">{summary}</p>
-                            <a href="{link}" target="_blank" style="display: inline-block; padding: 8px 15px; background: rgba(0, 255, 157, 0.1); border-radius: 8px; color: #00ff9d !important; text-decoration: none; font-weight: 600; transition: all 0.3s;">Read Full Article</a>
-                        </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    # Fallback to image if no video found
-                    image_url = None
-                    if "media_content" in entry:
-                        for media in entry["media_content"]:
-                            if media.get("type", "").startswith("image/"):
-                                image_url = media.get("url")
-                                break
-                    if not image_url and "enclosures" in entry:
-                        for enc in entry["enclosures"]:
-                            if enc.get("type", "").startswith("image/"):
-                                image_url = enc.get("href")
-                                break
-                    if not image_url:
-                        content = entry.get("content", [{}])[0].get("value", "") if "content" in entry else ""
-                        if content:
-                            soup = BeautifulSoup(content, "html.parser")
-                            img_tag = soup.find("img")
-                            if img_tag and img_tag.get("src"):
-                                image_url = img_tag["src"]
-                    if not image_url:
-                        image_url = "https://via.placeholder.com/600x300.png?text=No+Preview"
-                    
-                    st.markdown(f"""
-                        <div class="news-card glass-panel" style="margin-bottom: 25px;">
-                            <img src="{image_url}" alt="{title}" style="width: 100%; height: 180px; object-fit: cover; border-radius: 12px; margin-bottom: 15px;">
-                            <h4 style="margin-top: 0; margin-bottom: 10px; font-size: 18px;">{title}</h4>
-                            <small style="display: block; margin-bottom: 10px; color: #aaaaaa;">{feed_name} • {published_str}</small>
-                            <p style="font-size: 14px; margin-bottom: 15px; color: #e0e0e0;">{summary}</p>
-                            <a href="{link}" target="_blank" style="display: inline-block; padding: 8px 15px; background: rgba(0, 255, 157, 0.1); border-radius: 8px; color: #00ff9d !important; text-decoration: none; font-weight: 600; transition: all 0.3s;">Read Full Article</a>
-                        </div>
-                    """, unsafe_allow_html=True)
+        # Show only 3 articles (one row), rendered as a single grid element
+        cards = [render_news_card(entry, city_news["tz"], video_previews.get(entry.title),
+                                  time_format_24h=time_format_24h)
+                 for entry in all_entries[:3]]
+        st.markdown(render_html("news_grid", cards="".join(cards)), unsafe_allow_html=True)
         
         # "View More" button if there are more articles
         if len(all_entries) > 3:
@@ -1360,77 +3294,13 @@ with tab1:
         # Show all articles in horizontal scroller if requested
         if getattr(st.session_state, "show_all_news", False):
             st.markdown("#### 🔍 All News Articles")
-            st.markdown('<div class="news-scroller">', unsafe_allow_html=True)
-            
-            for idx, entry in enumerate(all_entries):
-                title = entry.get("title", "No title")
-                summary = entry.get("summary") or entry.get("description") or ""
-                link = entry.get("link", "#")
-                published = entry.get("published") or entry.get("updated") or ""
-                feed_name = entry.get("feed_name", "Unknown")
-                
-                # Get video preview for horizontal scroller
-                video_url = search_youtube_video(title)
-                
-                # Get image fallback
-                image_url = None
-                if "media_content" in entry:
-                    for media in entry["media_content"]:
-                        if media.get("type", "").startswith("image/"):
-                            image_url = media.get("url")
-                            break
-                if not image_url and "enclosures" in entry:
-                    for enc in entry["enclosures"]:
-                        if enc.get("type", "").startswith("image/"):
-                            image_url = enc.get("href")
-                            break
-                if not image_url:
-                    content = entry.get("content", [{}])[0].get("value", "") if "content" in entry else ""
-                    if content:
-                        soup = BeautifulSoup(content, "html.parser")
-                        img_tag = soup.find("img")
-                        if img_tag and img_tag.get("src"):
-                            image_url = img_tag["src"]
-                if not image_url:
-                    image_url = "https://via.placeholder.com/600x300.png?text=No+Preview"
-                
-                # Format published date
-                try:
-                    published_dt = date_parser.parse(published)
-                    published_str = published_dt.strftime("%b %d, %H:%M")
-                except:
-                    published_str = published
-                
-                # Truncate summary
-                if len(summary) > 200:
-                    summary = summary[:200] + "..."
-                
-                # Create card for horizontal scroller
-                st.markdown(f"""
-                    <div class="news-item" style="min-width: 300px; margin-right: 20px; display: inline-block;">
-                        <div class="news-card glass-panel" style="width: 300px; margin-bottom: 25px;">
-                            {f'''
-                            <div style="border-radius: 10px; overflow: hidden; margin-bottom: 15px; height: 180px;">
-                                <iframe width="100%" height="180" 
-                                        src="{video_url}?autoplay=1&mute=1" 
-                                        frameborder="0" 
-                                        allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; presentation" 
-                                        allowfullscreen
-                                        sandbox="allow-scripts allow-same-origin allow-presentation">
-                                </iframe>
-                            </div>
-                            ''' if video_url else f'''
-                            <img src="{image_url}" alt="{title}" style="width: 100%; height: 180px; object-fit: cover; border-radius: 12px; margin-bottom: 15px;">
-                            '''}
-                            <h4 style="margin-top: 0; margin-bottom: 10px; font-size: 18px;">{title}</h4>
-                            <small style="display: block; margin-bottom: 10px; color: #aaaaaa;">{feed_name} • {published_str}</small>
-                            <p style="font-size: 14px; margin-bottom: 15px; color: #e0e0e0;">{summary}</p>
-                            <a href="{link}" target="_blank" style="display: inline-block; padding: 8px 15px; background: rgba(0, 255, 157, 0.1); border-radius: 8px; color: #00ff9d !important; text-decoration: none; font-weight: 600; transition: all 0.3s;">Read Full Article</a>
-                        </div>
-                    </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown('</div>', unsafe_allow_html=True)
+            items = [
+                render_html("news_scroller_item", card=render_news_card(
+                    entry, city_news["tz"], video_previews.get(entry.title), video_height=180,
+                    time_format_24h=time_format_24h))
+                for entry in all_entries
+            ]
+            st.markdown(render_html("news_scroller", cards="".join(items)), unsafe_allow_html=True)
             
             # "Show Less" button
             if st.button("▲ Show Less", use_container_width=True):
@@ -1442,56 +3312,25 @@ with tab1:
     # ========== WEATHER FORECAST ==========
     st.markdown("### 🌦️ Weather Forecasts")
     
-    # Fetch weather data
-    forecast_json = fetch_14day_forecast(lat, lon)
-    hourly_json = fetch_hourly_forecast(lat, lon)
+    # Fetch weather data (daily and hourly come from one request, parsed once)
+    forecast = get_forecast(lat, lon)
     
     # 14-Day Forecast Carousel
     st.markdown("#### 🗓️ 14-Day Forecast")
-    display_weather_forecast(forecast_json, temp_unit)
+    display_weather_forecast(forecast, temp_unit)
     
     # Hourly Forecast Carousel
     st.markdown("#### ⏰ Daytime Forecast (8 AM - 8 PM)")
-    display_hourly_forecast(hourly_json, temp_unit)
+    display_hourly_forecast(forecast, temp_unit, time_format_24h)
     
     # Speak forecast functionality
-    if hourly_json and "hourly" in hourly_json:
-        hourly = hourly_json["hourly"]
-        times = hourly.get("time", [])
-        temps = hourly.get("temperature_2m", [])
-        codes = hourly.get("weathercode", [])
-        
-        # Filter daytime hours
-        filtered_data = []
-        for i, time_str in enumerate(times):
-            try:
-                time_fmt = datetime.strptime(time_str, "%Y-%m-%dT%H:%M")
-                hour = time_fmt.hour
-                if 8 <= hour <= 20:
-                    temp = temps[i]
-                    # Convert to Fahrenheit if needed
-                    if temp_unit == "Fahrenheit":
-                        temp = round((temp * 9/5) + 32)
-                    else:
-                        temp = round(temp)
-                    filtered_data.append({
-                        "time_str": time_str,
-                        "temp": temp,
-                        "code": codes[i],
-                        "hour": hour
-                    })
-            except Exception:
-                continue
-        filtered_data = filtered_data[:12]
-        
+    if forecast:
         if st.button("🔊 Speak Next 12h Weather Forecast", use_container_width=True, key="speak_weather_btn"):
             summary_lines = []
             unit_str = "degrees Fahrenheit" if temp_unit == "Fahrenheit" else "degrees Celsius"
-            for data in filtered_data:
-                time_fmt = datetime.strptime(data["time_str"], "%Y-%m-%dT%H:%M")
-                hour = time_fmt.strftime("%H:%M")
-                icon, desc = WEATHER_MAP.get(data["code"], ("🌈", "Unknown"))
-                summary_lines.append(f"At {hour}, {desc.lower()} with {data['temp']} {unit_str}.")
+            for hour, code, temp in forecast.daytime_hours(temp_unit):
+                icon, desc = WEATHER_MAP.get(code, ("🌈", "Unknown"))
+                summary_lines.append(f"At {hour}, {desc.lower()} with {temp} {unit_str}.")
             full_summary = "Next 12 hours: " + " ".join(summary_lines)
             speak(full_summary, lang=speech_lang)
 
@@ -1508,11 +3347,7 @@ with tab1:
 
                 for feed_idx, feed_row in feed_rows.iterrows():
                     with st.expander(f"### {feed_row['name']}", expanded=True):
-                        url = feed_row["url"]
-                        entries = []
-                        feed_data = fetch_feed(url)
-                        if feed_data and "entries" in feed_data:
-                            entries = filter_recent_entries(feed_data["entries"], minutes=feed_interval_minutes)
+                        entries = city_news["feeds"].get(feed_row["url"], [])
 
                         if not entries:
                             st.info("No recent news found.")
@@ -1528,31 +3363,17 @@ with tab1:
                                 if idx < len(entries):
                                     entry = entries[idx]
                                     with cols[col_idx]:
-                                        title = entry.get("title", "No title")
-                                        summary = entry.get("summary") or entry.get("description") or ""
-                                        link = entry.get("link", "#")
-                                        published = entry.get("published") or entry.get("updated") or ""
-                                        published_str = published if published else ""
+                                        title = entry.title
+                                        summary = entry.summary
                                         
                                         with st.container():
-                                            st.markdown(f"### [{title}]({link})")
-                                            st.markdown(f"<span style='color:#aaaaaa'>{published_str}</span>", unsafe_allow_html=True)
-                                            st.markdown(f"<div style='color:#cccccc'>{summary[:200] + '...' if len(summary) > 200 else summary}</div>", unsafe_allow_html=True)
+                                            st.markdown(render_tab_entry(entry, city_news["tz"], time_format_24h),
+                                                        unsafe_allow_html=True)
 
-                                            video_url = search_youtube_video(title)
+                                            video_url = video_previews.get(title)
                                             if video_url:
                                                 st.markdown("#### ▶️ Related Video Preview")
-                                                components.html(f"""
-                                                    <div style="border-radius: 10px; overflow: hidden; margin-bottom: 15px;">
-                                                        <iframe width="100%" height="200" 
-                                                                src="{video_url}" 
-                                                                frameborder="0" 
-                                                                allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; presentation" 
-                                                                allowfullscreen
-                                                                sandbox="allow-scripts allow-same-origin allow-presentation">
-                                                        </iframe>
-                                                    </div>
-                                                """, height=240)
+                                                components.html(render_tab_video(video_url), height=240)
 
                                             if st.button(f"🔊 Speak: {title[:20]}...", 
                                                        key=f"speak_{feed_idx}_{idx}", 
@@ -1562,9 +3383,7 @@ with tab1:
                         # Summarize all articles
                         all_texts = []
                         for entry in entries:
-                            title = entry.get("title", "No Title")
-                            summary = entry.get("summary") or entry.get("description") or ""
-                            all_texts.append(f"{title}. {summary}")
+                            all_texts.append(f"{entry.title}. {entry.summary}")
 
                         combined_text = "\n\n".join(all_texts)
 
@@ -1581,16 +3400,9 @@ with tab1:
 
     if st.button("🔊 Summarize All Feeds in City + Download MP3", key="summarize_city_all", use_container_width=True):
         all_texts = []
-        for _, feed_row in df_city.iterrows():
-            url = feed_row["url"]
-            feed_data = fetch_feed(url)
-            if not feed_data or "entries" not in feed_data:
-                continue
-            entries = filter_recent_entries(feed_data["entries"], minutes=feed_interval_minutes)
+        for entries in city_news["feeds"].values():
             for entry in entries:
-                title = entry.get("title", "No Title")
-                summary = entry.get("summary") or entry.get("description") or ""
-                all_texts.append(f"{title}. {summary}")
+                all_texts.append(f"{entry.title}. {entry.summary}")
 
         combined_text = "\n\n".join(all_texts)
         if not combined_text.strip():
@@ -0,0 +1,84 @@
+"""Local HTTP stub server for tests that drive the app's real network code.
+
+Each route is a function taking the request handler and returning
+(status, headers, body); every request is recorded for assertions.
+"""
+import http.server
+import pathlib
+import sys
+import threading
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from app_definitions import load_definitions
+
+# smart_request / smart_request_many and everything they call, minus the singletons
+REQUEST_DEFINITIONS = (
+    "HTTP_POOL_CONNECTIONS", "HTTP_POOL_MAXSIZE", "HTTP_MAX_PROXY_SESSIONS",
+    "ConnectionStats", "counting_pool_class", "CountingHTTPAdapter", "HttpSessionPool",
+    "BREAKER_FAILURE_THRESHOLD", "BREAKER_BASE_BACKOFF", "BREAKER_MAX_BACKOFF",
+    "HostCircuitBreakers", "RequestAttempts", "in_background_thread", "get_retry_budget",
+    "ASYNC_CONNECTION_LIMIT", "ASYNC_CONNECTIONS_PER_HOST", "AsyncResponse", "AsyncHttpRunner",
+    "get_best_proxy", "release_proxy", "GEO_BLOCK_TERMS", "GEO_BLOCK_SCAN_BYTES",
+    "GEO_BLOCK_SKIP_HOSTS", "compile_geo_block_matcher", "GEO_BLOCK_MATCHER", "is_geo_blocked",
+    "smart_request", "smart_request_async", "smart_request_many",
+)
+
+_async_http = None
+
+def load_with_requests(*names, **overrides):
+    """load_definitions(*names) plus the real request stack.
+
+    Sessions and breakers are fresh per call; the event loop is shared by the
+    whole test run, like the app's process-wide one.
+    """
+    global _async_http
+    app = load_definitions(*REQUEST_DEFINITIONS, *names, **overrides)
+    app["HTTP_SESSIONS"] = app["HttpSessionPool"]()
+    app["HOST_BREAKERS"] = app["HostCircuitBreakers"]()
+    if _async_http is None:
+        _async_http = app["AsyncHttpRunner"]()
+    app["ASYNC_HTTP"] = _async_http
+    return app
+
+class StubServer:
+    """Serves `routes` ({path: handler}) on an ephemeral localhost port"""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []  # (path, query, headers) of every request, in arrival order
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                path, _, query = self.path.partition("?")
+                with stub.lock:
+                    stub.requests.append((path, query, dict(self.headers)))
+                route = stub.routes.get(path)
+                status, headers, body = route(self) if route else (404, {}, b"")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,65 @@
+"""fetch_feed_conditional against a local stub that serves an ETag, then 304.
+
+    python -m unittest discover tests
+"""
+import unittest
+
+from stub_server import StubServer, load_with_requests
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Stub Feed</title>
+<item><title>First</title><link>http://example.com/1</link>
+<description>&lt;p&gt;One &lt;img src="http://img.example/1.jpg"&gt;&lt;/p&gt;</description>
+<pubDate>Sat, 17 Oct 2026 09:00:00 GMT</pubDate></item>
+<item><title>Second</title><link>http://example.com/2</link>
+<description>Two</description>
+<pubDate>Sat, 17 Oct 2026 08:00:00 GMT</pubDate></item>
+</channel></rss>"""
+ETAG = '"v1"'
+
+def load_app():
+    return load_with_requests(
+        "entry_timestamp", "ENTRY_SUMMARY_MAX_CHARS", "IMG_SRC_RE", "TAG_DELIMITER_RE", "tag_end",
+        "first_img_src", "extract_entry_image", "ENTRY_COLUMNS", "HTML_TAG_RE", "strip_html",
+        "normalize_entries", "fetch_feed_conditional",
+    )
+
+def feed_route(handler):
+    if handler.headers.get("If-None-Match") == ETAG:
+        return 304, {"ETag": ETAG}, b""
+    return 200, {"Content-Type": "application/rss+xml", "ETag": ETAG}, RSS
+
+class FetchFeedConditionalTest(unittest.TestCase):
+    def setUp(self):
+        self.app = load_app()
+
+    def test_revalidates_and_reuses_parsed_feed(self):
+        validators = {}
+        with StubServer({"/rss": feed_route}) as stub:
+            url = stub.url("/rss")
+            first = self.app["fetch_feed_conditional"](url, validators)
+            second = self.app["fetch_feed_conditional"](url, validators)
+
+        self.assertEqual(len(stub.requests), 2)
+        self.assertNotIn("If-None-Match", stub.requests[0][2])
+        self.assertEqual(stub.requests[1][2].get("If-None-Match"), ETAG)
+        self.assertEqual(first["feed"]["title"], "Stub Feed")
+        self.assertEqual(first["entries"]["title"], ["First", "Second"])
+        self.assertEqual(first["entries"]["image"][0], "http://img.example/1.jpg")
+        self.assertEqual(validators[url]["etag"], ETAG)
+        self.assertIs(second, first)  # 304: the stored parse is returned, nothing re-parsed
+
+    def test_without_validators_is_not_remembered(self):
+        validators = {}
+        route = lambda handler: (200, {"Content-Type": "application/rss+xml"}, RSS)
+        with StubServer({"/rss": route}) as stub:
+            url = stub.url("/rss")
+            self.app["fetch_feed_conditional"](url, validators)
+            self.app["fetch_feed_conditional"](url, validators)
+
+        self.assertEqual(len(stub.requests), 2)
+        self.assertNotIn("If-None-Match", stub.requests[1][2])
+        self.assertNotIn(url, validators)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""first_img_src on quoted attributes, skipped sources and unterminated tags.
+
+    python -m unittest discover tests
+"""
+import pathlib
+import sys
+import unittest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from app_definitions import load_definitions
+
+app = load_definitions("IMG_SRC_RE", "TAG_DELIMITER_RE", "tag_end", "first_img_src")
+first_img_src = app["first_img_src"]
+
+class FirstImgSrcTest(unittest.TestCase):
+    def test_gt_inside_quoted_attribute(self):
+        self.assertEqual(first_img_src('<img alt="a > b" src="x.jpg">'), "x.jpg")
+        self.assertEqual(first_img_src("<img alt='a > b' src=y.jpg>"), "y.jpg")
+        self.assertEqual(first_img_src('<img alt=">" ><img src="z.jpg">'), "z.jpg")
+
+    def test_case_and_entities(self):
+        self.assertEqual(first_img_src('<p>x</p><IMG SRC="a.png?w=1&amp;h=2" />'), "a.png?w=1&h=2")
+
+    def test_skips_data_uris(self):
+        self.assertEqual(first_img_src('<img src="data:image/gif;base64,R0"><img src="b.gif">'), "b.gif")
+
+    def test_unterminated(self):
+        self.assertIsNone(first_img_src('<img alt="x" src="c.jpg"'))
+        self.assertIsNone(first_img_src('<img alt="never closed src="c.jpg">'))
+        self.assertIsNone(first_img_src("<img " * 1000))
+        self.assertIsNone(first_img_src(""))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Bulk Open-Meteo fetches against a local stub that answers like the real API:
+a single object for one location, a list in request order for several.
+
+    python -m unittest discover tests
+"""
+import json
+import unittest
+import urllib.parse
+
+from stub_server import StubServer, load_with_requests
+
+BATCH = 3
+COORDS = [(10.0 + i, 20.0 + i) for i in range(7)]
+
+def location(lat, lon):
+    return {
+        "latitude": lat, "longitude": lon,
+        "daily": {"time": ["2026-10-17", "2026-10-18"], "weathercode": [0, 3],
+                  "temperature_2m_max": [20.5, 18.0], "temperature_2m_min": [10.0, 9.5]},
+        "hourly": {"time": [f"2026-10-17T{h:02d}:00" for h in range(24)],
+                   "temperature_2m": [10.0 + h / 2 for h in range(24)], "weathercode": [1] * 24},
+    }
+
+def meteo_route(handler):
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(handler.path).query)
+    lats = [float(v) for v in query["latitude"][0].split(",")]
+    lons = [float(v) for v in query["longitude"][0].split(",")]
+    data = [location(lat, lon) for lat, lon in zip(lats, lons)]
+    body = json.dumps(data[0] if len(data) == 1 else data).encode()
+    return 200, {"Content-Type": "application/json"}, body
+
+class MemoryDiskCache:
+    """Stands in for DiskCache: ForecastStore only reads and writes through get/set"""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key):
+        return self.entries.get(key), key in self.entries
+
+    def set(self, key, value, ttl, stale_ttl=0):
+        self.entries[key] = value
+
+class FetchForecastsBulkTest(unittest.TestCase):
+    def setUp(self):
+        self.stub = StubServer({"/forecast": meteo_route}).__enter__()
+        self.addCleanup(self.stub.__exit__)
+        self.app = load_with_requests(
+            "FORECAST_GRID_RESOLUTION", "FORECAST_STALE_TTL", "FORECAST_MODEL_UPDATE_INTERVAL",
+            "FORECAST_MODEL_UPDATE_DELAY", "FORECAST_FETCH_TIMEOUT", "FORECAST_DAYS",
+            "DAYTIME_HOURS", "convert_temperatures", "forecast_series",
+            "weather_codes", "Forecast", "parse_forecast", "forecast_cell", "forecast_cell_center",
+            "next_model_update", "forecast_ttl", "disk_cache_key", "forecast_url",
+            "fetch_forecasts_bulk", "ForecastStore",
+            OPEN_METEO_FORECAST_URL=self.stub.url("/forecast"), FORECAST_BULK_BATCH=BATCH,
+        )
+
+    def requested_latitudes(self):
+        return [urllib.parse.parse_qs(query)["latitude"][0].split(",")
+                for _, query, _ in self.stub.requests]
+
+    def test_splits_into_batches_and_aligns_results(self):
+        results = self.app["fetch_forecasts_bulk"](COORDS)
+
+        # 7 locations in batches of 3: two list responses and one single-object response
+        self.assertEqual([len(lats) for lats in self.requested_latitudes()], [3, 3, 1])
+        self.assertEqual(len(results), len(COORDS))
+        self.assertEqual([(r["latitude"], r["longitude"]) for r in results], COORDS)
+
+    def test_single_location_object(self):
+        results = self.app["fetch_forecasts_bulk"](COORDS[:1])
+
+        self.assertEqual(len(self.stub.requests), 1)
+        self.assertEqual([(r["latitude"], r["longitude"]) for r in results], COORDS[:1])
+
+    def test_failed_batch_is_none_for_its_locations_only(self):
+        def flaky_route(handler):
+            if "latitude=13.0," in handler.path:
+                return 404, {}, b""
+            return meteo_route(handler)
+        self.stub.routes["/forecast"] = flaky_route
+
+        results = self.app["fetch_forecasts_bulk"](COORDS)
+
+        self.assertEqual([r is None for r in results], [False] * 3 + [True] * 3 + [False])
+
+    def test_store_refresh_bulk(self):
+        store = self.app["ForecastStore"](MemoryDiskCache(), start_prefetcher=False)
+        cells = [self.app["forecast_cell"](lat, lon) for lat, lon in COORDS]
+
+        self.assertEqual(store.refresh_bulk(cells), len(COORDS))
+        self.assertEqual(len(self.stub.requests), 3)
+        self.assertEqual(store.status()["cells"], len(COORDS))
+        self.assertEqual(store.status()["in_flight"], 0)
+        # Served from memory afterwards, no further requests
+        self.assertEqual(len(store.get(*COORDS[6]).days()), 2)
+        self.assertEqual(len(self.stub.requests), 3)
+
+if __name__ == "__main__":
+    unittest.main()